@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import atexit
+import base64
+import collections
+import copy
 import json
+import math
 import csv
 import logging
 import os
+import queue
 import random
 import re
+import sqlite3
+import threading
 import time
 from datetime import datetime, timedelta
 import getpass
 from pathlib import Path
 
-import pandas as pd
-import pyautogui
 import yaml
-from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -25,7 +30,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 
 
 log = logging.getLogger(__name__)
@@ -48,23 +52,1474 @@ def setupLogger() -> None:
     log.addHandler(c_handler)
 
 
+def resolve_chromedriver(cache_file='.chromedriver_path', refresh=False) -> str:
+    """Path to chromedriver, installed by webdriver_manager only when the cached one is gone.
+
+    refresh drops the cached path and installs the driver matching the current Chrome,
+    used after Chrome updated itself and the cached driver no longer starts it.
+    """
+    cache = Path(cache_file)
+    if refresh:
+        cache.unlink(missing_ok=True)
+    elif cache.is_file():
+        driver_path: str = cache.read_text().strip()
+        if os.path.isfile(driver_path):
+            log.debug(f"Using cached chromedriver {driver_path}")
+            return driver_path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = ChromeDriverManager().install()
+    cache.write_text(driver_path)
+    log.info(f"Installed chromedriver {driver_path}")
+    return driver_path
+
+
+class JobLedger:
+    """SQLite index of every job ID the bot has already processed.
+
+    Lookups are answered from an in-memory set so the check before each
+    navigation is O(1); the database keeps the IDs across restarts and is
+    indexed by company so past results can be queried without the CSV.
+    """
+
+    COLUMNS: dict = {"job": "TEXT", "company": "TEXT"}
+
+    def __init__(self, path, retention_days=2, seed_csv=None) -> None:
+        self.path = Path(path)
+        self.retention = timedelta(days=retention_days) if retention_days else None
+        new_db: bool = not self.path.is_file()
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS jobs ("
+                          "jobID TEXT PRIMARY KEY, status TEXT NOT NULL, timestamp TEXT NOT NULL)")
+        # Ledgers created before job and company were tracked only have the first three columns
+        existing: set = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in self.COLUMNS.items():
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company)")
+        self.conn.commit()
+        if new_db and seed_csv is not None:
+            self.import_csv(seed_csv)
+        self.ids: set = self.load_ids()
+        log.info(f"{len(self.ids)} jobIDs found in ledger {self.path}")
+
+    def import_csv(self, filename) -> None:
+        # Bootstraps the ledger from an output file written by older versions
+        if not Path(filename).is_file():
+            return
+        rows = []
+        with open(filename, newline='', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                if len(row) < 6 or row[1] == 'jobID':
+                    continue
+                status = "applied" if row[5] == "True" else "attempted" if row[4] == "True" else "skipped"
+                rows.append((row[1], status, row[0], row[2], row[3]))
+        with self.lock:
+            self.conn.executemany("INSERT OR IGNORE INTO jobs (jobID, status, timestamp, job, company) "
+                                  "VALUES (?, ?, ?, ?, ?)", rows)
+            self.conn.commit()
+        log.info(f"Imported {len(rows)} rows from {filename} into the job ledger")
+
+    def load_ids(self) -> set:
+        query = "SELECT jobID FROM jobs"
+        params: tuple = ()
+        if self.retention is not None:
+            query += " WHERE timestamp > ?"
+            params = ((datetime.now() - self.retention).strftime('%Y-%m-%d %H:%M:%S'),)
+        with self.lock:
+            return {row[0] for row in self.conn.execute(query, params)}
+
+    def seen(self, jobID) -> bool:
+        return str(jobID) in self.ids
+
+    def record(self, jobID, status, job=None, company=None, timestamp=None) -> None:
+        timestamp = timestamp if timestamp else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO jobs (jobID, status, timestamp, job, company) "
+                              "VALUES (?, ?, ?, ?, ?)", (str(jobID), status, timestamp, job, company))
+            self.conn.commit()
+        self.ids.add(str(jobID))
+
+    def lookup(self, jobID) -> dict | None:
+        with self.lock:
+            cursor = self.conn.execute("SELECT * FROM jobs WHERE jobID = ?", (str(jobID),))
+            row = cursor.fetchone()
+            names: list = [d[0] for d in cursor.description]
+        return dict(zip(names, row)) if row else None
+
+    def by_company(self, company) -> list:
+        with self.lock:
+            cursor = self.conn.execute("SELECT * FROM jobs WHERE company = ? ORDER BY timestamp", (company,))
+            names: list = [d[0] for d in cursor.description]
+            return [dict(zip(names, row)) for row in cursor]
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class OutputWriter:
+    """Appends result rows to the output CSV through one line-buffered handle.
+
+    A header is written when the file is created, and the file is fsynced
+    every fsync_interval seconds instead of being reopened for every job.
+    """
+
+    HEADER: list = ['timestamp', 'jobID', 'job', 'company', 'attempted', 'result']
+
+    def __init__(self, filename, fsync_interval=30) -> None:
+        self.fsync_interval: float = fsync_interval
+        self.lock = threading.Lock()
+        new_file: bool = not os.path.isfile(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, 'a', buffering=1, newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.last_sync: float = time.time()
+        if new_file:
+            self.writer.writerow(self.HEADER)
+
+    def write(self, row) -> None:
+        with self.lock:
+            self.writer.writerow(row)
+            if time.time() - self.last_sync >= self.fsync_interval:
+                os.fsync(self.file.fileno())
+                self.last_sync = time.time()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+
+class NetworkFilter:
+    """Blocks unwanted requests through the Chrome DevTools Protocol.
+
+    Network.setBlockedURLs only takes URL patterns, so resource types are
+    blocked through the file extensions they are served with. Static JS and
+    CSS bundles are kept across sessions by Chrome's own disk cache, pointed
+    at a persistent directory in browser_options.
+    """
+
+    DEFAULT_PATTERNS: list = [
+        "*doubleclick.net*",
+        "*googletagmanager.com*",
+        "*google-analytics.com*",
+        "*bat.bing.com*",
+        "*px.ads.linkedin.com*",
+        "*linkedin.com/li/track*",
+        "*linkedin.com/realtime/*",
+    ]
+    RESOURCE_PATTERNS: dict = {
+        "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*media.licdn.com/dms/image*"],
+        "font": ["*.woff*", "*.ttf*", "*.otf*"],
+        "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"],
+    }
+
+    # Resource timing entries report transferSize 0 for responses served from the cache.
+    # Blocked requests never get an entry, so what blocking saves is not measured here.
+    PAGE_STATS_SCRIPT: str = """
+        var stats = {requests: 0, transferred: 0, cached: 0};
+        performance.getEntriesByType('resource').forEach(function (entry) {
+            stats.requests += 1;
+            stats.transferred += entry.transferSize || 0;
+            if (!entry.transferSize && entry.decodedBodySize) {
+                stats.cached += entry.decodedBodySize;
+            }
+        });
+        return stats;
+    """
+
+    def __init__(self, patterns=None, resource_types=[]) -> None:
+        self.urls: list = list(self.DEFAULT_PATTERNS if patterns is None else patterns)
+        for resource_type in resource_types:
+            self.urls += self.RESOURCE_PATTERNS.get(resource_type, [])
+        self.lock = threading.Lock()
+        self.totals: dict = {"pages": 0, "requests": 0, "transferred": 0, "cached": 0}
+
+    def install(self, browser) -> None:
+        browser.execute_cdp_cmd("Network.enable", {})
+        browser.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.urls})
+        log.info(f"Blocking {len(self.urls)} URL patterns")
+
+    def record_page(self, browser) -> None:
+        try:
+            stats: dict = browser.execute_script(self.PAGE_STATS_SCRIPT)
+        except Exception as e:
+            log.debug(f"Could not read page network stats: {e}")
+            return
+        with self.lock:
+            self.totals["pages"] += 1
+            for key in ("requests", "transferred", "cached"):
+                self.totals[key] += stats[key]
+        log.debug(f"Page used {stats['requests']} requests, {stats['transferred'] // 1024} KB transferred, "
+                  f"{stats['cached'] // 1024} KB saved by the cache")
+
+    def summary(self) -> str:
+        with self.lock:
+            totals = dict(self.totals)
+        return (f"{totals['pages']} pages, {totals['requests']} requests, "
+                f"{totals['transferred'] // 1024} KB transferred, {totals['cached'] // 1024} KB served from cache "
+                f"(cache savings only, blocked requests are not counted)")
+
+
+class DailyQuotaReached(Exception):
+    """Raised by RateGovernor.acquire once today's quota for an action is used up"""
+
+
+class TokenBucket:
+    """Allows rate_per_hour actions on average with bursts of up to burst"""
+
+    def __init__(self, rate_per_hour, burst=1) -> None:
+        self.rate: float = rate_per_hour / 3600.0
+        self.capacity: float = float(burst)
+        self.tokens: float = float(burst)
+        self.updated: float = time.time()
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before it may be used"""
+        now: float = time.time()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateGovernor:
+    """Central pacing for every browser in the session.
+
+    acquire(kind) blocks until the token bucket for kind ("navigation" or
+    "submission") allows another action, adds human-like jitter and enforces
+    the daily quota. Today's counts are kept in a JSON file so a restart
+    does not reset the quota.
+    """
+
+    def __init__(self, rate_limits={}, daily_quota={}, jitter={}, state_file=None) -> None:
+        self.lock = threading.Lock()
+        for kind, limit in rate_limits.items():
+            if not limit.get("per_hour", 0) > 0 or not limit.get("burst", 1) >= 1:
+                raise ValueError(f"rate_limits.{kind} needs per_hour > 0 and burst >= 1, "
+                                 f"use daily_quota to stop an action altogether")
+        self.buckets: dict = {kind: TokenBucket(limit["per_hour"], limit.get("burst", 1))
+                              for kind, limit in rate_limits.items()}
+        self.daily_quota: dict = daily_quota
+        self.jitter: dict = jitter
+        self.state_file = Path(state_file) if state_file else None
+        self.today: str = datetime.now().strftime('%Y-%m-%d')
+        self.counts: collections.Counter = collections.Counter()
+        if self.state_file is not None and self.state_file.is_file():
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state: dict = json.load(f)
+            if state.get("date") == self.today:
+                self.counts.update(state.get("counts", {}))
+
+    def jitter_delay(self) -> float:
+        distribution = self.jitter.get("distribution", "none")
+        if distribution == "uniform":
+            return random.uniform(self.jitter.get("min", 0.5), self.jitter.get("max", 2.0))
+        if distribution == "lognormal":
+            return random.lognormvariate(self.jitter.get("mu", 0.0), self.jitter.get("sigma", 0.5))
+        if distribution == "exponential":
+            return random.expovariate(1.0 / self.jitter.get("mean", 1.0))
+        return 0.0
+
+    def acquire(self, kind="navigation") -> None:
+        with self.lock:
+            today: str = datetime.now().strftime('%Y-%m-%d')
+            if today != self.today:
+                self.today = today
+                self.counts.clear()
+            quota = self.daily_quota.get(kind)
+            if quota is not None and self.counts[kind] >= quota:
+                raise DailyQuotaReached(f"Daily {kind} quota of {quota} reached")
+            self.counts[kind] += 1
+            wait: float = self.buckets[kind].reserve() if kind in self.buckets else 0.0
+            self.save()
+        delay: float = wait + self.jitter_delay()
+        if delay > 0:
+            log.debug(f"Pacing {kind}, sleeping for {round(delay, 1)}s")
+            time.sleep(delay)
+
+    def save(self) -> None:
+        if self.state_file is None:
+            return
+        tmp = self.state_file.with_suffix(self.state_file.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"date": self.today, "counts": dict(self.counts)}, f)
+        os.replace(tmp, self.state_file)
+
+
+class PersistentJobQueue:
+    """Bounded FIFO of discovered job IDs, mirrored to SQLite.
+
+    A job stays in the queue file until task_done is called for it, so jobs
+    discovered or in flight when the bot crashes are picked up on the next run.
+    """
+
+    def __init__(self, path, maxsize=100) -> None:
+        self.maxsize: int = maxsize
+        self.cond = threading.Condition()
+        self.closed: bool = False
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS queue ("
+                          "seq INTEGER PRIMARY KEY AUTOINCREMENT, jobID TEXT UNIQUE, added TEXT NOT NULL)")
+        self.conn.commit()
+        self.pending = collections.deque(row[0] for row in self.conn.execute("SELECT jobID FROM queue ORDER BY seq"))
+        self.in_flight: set = set()
+        if self.pending:
+            log.info(f"Restored {len(self.pending)} queued jobIDs from {path}")
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def put(self, jobID) -> bool:
+        """Enqueue a job ID, blocking while the queue is full. Returns False for duplicates"""
+        jobID = str(jobID)
+        with self.cond:
+            if jobID in self.in_flight or jobID in self.pending:
+                return False
+            while len(self.pending) >= self.maxsize and not self.closed:
+                self.cond.wait()
+            timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self.conn.execute("INSERT OR IGNORE INTO queue (jobID, added) VALUES (?, ?)", (jobID, timestamp))
+            self.conn.commit()
+            self.pending.append(jobID)
+            self.cond.notify_all()
+            return True
+
+    def get(self):
+        """Next job ID to process, or None once the queue is closed"""
+        with self.cond:
+            while not self.pending and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                return None
+            jobID = self.pending.popleft()
+            self.in_flight.add(jobID)
+            self.cond.notify_all()
+            return jobID
+
+    def task_done(self, jobID) -> None:
+        with self.cond:
+            self.conn.execute("DELETE FROM queue WHERE jobID = ?", (jobID,))
+            self.conn.commit()
+            self.in_flight.discard(jobID)
+            self.cond.notify_all()
+
+    def join(self) -> None:
+        with self.cond:
+            while (self.pending or self.in_flight) and not self.closed:
+                self.cond.wait()
+
+    def close(self) -> None:
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class ApplyWorkerPool:
+    """Runs apply_to_job on several logged-in browsers fed from one job queue.
+
+    Each worker is a shallow copy of the bot with its own Chrome session, so
+    the ledger, answers and rate governor stay shared between all of them.
+    """
+
+    def __init__(self, bot, size, jobs) -> None:
+        self.jobs: PersistentJobQueue = jobs
+        self.workers: list = [bot.clone_with_new_browser(i) for i in range(size)]
+        self.threads: list = []
+        for i, worker in enumerate(self.workers):
+            thread = threading.Thread(target=self.run, args=(worker,), name=f"apply-worker-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        log.info(f"Started {size} apply workers")
+
+    def run(self, worker) -> None:
+        while True:
+            jobID = self.jobs.get()
+            if jobID is None:
+                return
+            try:
+                if not worker.ledger.seen(jobID):
+                    applied = worker.apply_to_job(jobID)
+                    if applied:
+                        log.info(f"Applied to {jobID}")
+                    else:
+                        log.info(f"Failed to apply to {jobID}")
+            except DailyQuotaReached as e:
+                # Leave the job in the queue file for the next run and stop every worker
+                log.info(f"{e}, stopping apply workers")
+                self.jobs.close()
+                return
+            except Exception as e:
+                log.error(f"Worker failed on {jobID}: {e}")
+            self.jobs.task_done(jobID)
+
+    def submit(self, jobID) -> bool:
+        return self.jobs.put(jobID)
+
+    def join(self) -> None:
+        self.jobs.join()
+
+    def close(self) -> None:
+        self.jobs.close()
+        for thread in self.threads:
+            thread.join()
+        for worker in self.workers:
+            try:
+                worker.browser.quit()
+            except Exception as e:
+                log.debug(f"Error closing worker browser: {e}")
+
+
+class QuestionDeferred(Exception):
+    """Raised when a form question has no known answer and questions are deferred"""
+
+    def __init__(self, question) -> None:
+        super().__init__(f"No answer for question: {question}")
+        self.question = question
+
+
+class ParkedApplications:
+    """Applications put aside until their unanswered question gets an answer.
+
+    Parked jobs and the form answers given so far are kept in a JSON file.
+    Unanswered questions are listed in a Question,Answer CSV; answers filled
+    in there are picked up by the next resume pass.
+    """
+
+    def __init__(self, path, questions_path) -> None:
+        self.path = Path(path)
+        self.questions_path = Path(questions_path)
+        self.lock = threading.Lock()
+        self.jobs: dict = {}
+        if self.path.is_file():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.jobs = json.load(f)
+            log.info(f"{len(self.jobs)} parked applications waiting for answers")
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def park(self, jobID, question, form_answers) -> None:
+        with self.lock:
+            self.jobs[str(jobID)] = {
+                "question": question,
+                "answers": form_answers,
+                "parked": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            self.save()
+            questions: dict = self.read_questions()
+            if question not in questions:
+                questions[question] = ""
+                self.write_questions(questions)
+
+    def take_answers(self) -> dict:
+        """Remove and return the questions that were answered in the questions file"""
+        with self.lock:
+            questions: dict = self.read_questions()
+            answered: dict = {q: a for q, a in questions.items() if a.strip()}
+            if answered:
+                self.write_questions({q: a for q, a in questions.items() if q not in answered})
+            return answered
+
+    def ready(self, known_answers, rules) -> list:
+        """Parked jobs whose question is now answered, in the QA store or by a question rule"""
+        # "user provided" is the placeholder left for questions nobody answered yet
+        return [jobID for jobID, job in self.jobs.items()
+                if known_answers.get(job["question"], "user provided") != "user provided"
+                or rules.match(job["question"]) is not None]
+
+    def remove(self, jobID) -> None:
+        with self.lock:
+            self.jobs.pop(str(jobID), None)
+            self.save()
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.jobs, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def read_questions(self) -> dict:
+        if not self.questions_path.is_file():
+            return {}
+        with open(self.questions_path, newline='', encoding='utf-8') as f:
+            return {row["Question"]: row["Answer"] or "" for row in csv.DictReader(f)}
+
+    def write_questions(self, questions) -> None:
+        tmp = self.questions_path.with_suffix(self.questions_path.suffix + '.tmp')
+        with open(tmp, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["Question", "Answer"])
+            writer.writerows(questions.items())
+        os.replace(tmp, self.questions_path)
+
+
+class CardFilter:
+    """Decides from a harvested job card alone whether the job is worth opening.
+
+    Company names are normalized and looked up in a set, title keywords are
+    matched with a single compiled pattern, and optional include rules keep
+    only titles or locations that contain one of their keywords. Every card
+    skipped here saves a job page navigation; counts() reports how many
+    cards each rule skipped.
+    """
+
+    # Legal form suffixes, only stripped from the end of a name ("Co-op Bank" and "AG Barr" keep theirs)
+    COMPANY_SUFFIXES = re.compile(r"(\s+(inc|llc|ltd|limited|corp|corporation|co|gmbh|plc|ag|sa|s a))+$")
+
+    def __init__(self, companies=[], titles=[], include_titles=[], include_locations=[]) -> None:
+        # An entry made only of a suffix such as "Inc." normalizes to '' and would match unreadable companies
+        self.companies: set = {self.normalize(c) for c in companies if c} - {""}
+        self.titles = self.keyword_pattern(titles)
+        self.include_titles = self.keyword_pattern(include_titles)
+        self.include_locations = self.keyword_pattern(include_locations)
+        self.lock = threading.Lock()
+        self.skipped: collections.Counter = collections.Counter()
+
+    @classmethod
+    def normalize(cls, company) -> str:
+        # "S.A." and "S A" both collapse to "s a", which is matched as one suffix
+        company = " ".join(re.sub(r"[^\w\s]", " ", company.lower()).split())
+        return cls.COMPANY_SUFFIXES.sub("", company)
+
+    @staticmethod
+    def keyword_pattern(keywords):
+        keywords = [k for k in keywords if k]
+        if not keywords:
+            return None
+        return re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)), re.IGNORECASE)
+
+    def title_blocked(self, title) -> bool:
+        return self.titles is not None and self.titles.search(title) is not None
+
+    def reason(self, card):
+        """Name of the rule that rejects the card, or None when it passes"""
+        if self.companies and self.normalize(card["company"]) in self.companies:
+            return "company"
+        if self.title_blocked(card["title"]):
+            return "title"
+        if self.include_titles is not None and not self.include_titles.search(card["title"]):
+            return "include_titles"
+        if self.include_locations is not None and not self.include_locations.search(card["location"]):
+            return "include_locations"
+        return None
+
+    def accept(self, card) -> bool:
+        reason = self.reason(card)
+        if reason is None:
+            return True
+        with self.lock:
+            self.skipped[reason] += 1
+        log.debug(f"Skipping {card['jobID']}, {reason} rule matched {card['title']} at {card['company']}")
+        return False
+
+    def counts(self) -> dict:
+        with self.lock:
+            return dict(self.skipped)
+
+
+class SessionSeen:
+    """Job IDs already met during this run, under any position and location.
+
+    LinkedIn job IDs are numeric and kept as ints, which is far smaller than a
+    set of strings on long runs. Repeat sightings are counted as duplicates.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.ids: set = set()
+        self.duplicates: int = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, jobID) -> bool:
+        """Remember jobID, returns False when it was already seen this session"""
+        key = int(jobID) if str(jobID).isdigit() else jobID
+        with self.lock:
+            if key in self.ids:
+                self.duplicates += 1
+                return False
+            self.ids.add(key)
+            return True
+
+
+class SearchCursors:
+    """Result offset reached for each (position, location) search, kept in a JSON file.
+
+    A restart continues each search where the last run stopped; a search that
+    ran out of results starts over from the first page next time.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.cursors: dict = {}
+        if self.path.is_file():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.cursors = json.load(f)
+
+    @staticmethod
+    def key(position, location) -> str:
+        return f"{position}|{location}"
+
+    def get(self, position, location) -> int:
+        return self.cursors.get(self.key(position, location), 0)
+
+    def set(self, position, location, start) -> None:
+        with self.lock:
+            self.cursors[self.key(position, location)] = start
+            self.save()
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.cursors, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+class ComboScheduler:
+    """Chooses which (position, location) search runs next, by observed yield.
+
+    Yield is new jobs found plus applications sent per minute of searching.
+    Every combo is tried once in random order, after that slices go to the
+    combo with the best UCB1 score, so productive searches get most of the
+    time while the others are still revisited now and then. A combo whose
+    results ran out, or that used up its max_minutes of searching, is dropped
+    for the rest of the run. Applications are
+    credited to the combo that found the job, even when a worker applies
+    after the search has moved on.
+    """
+
+    def __init__(self, max_minutes=None, exploration=1.0) -> None:
+        self.max_minutes = max_minutes
+        self.exploration: float = exploration
+        self.lock = threading.Lock()
+        self.stats: dict = {}
+        self.untried: list = []
+        self.current = None
+        self.sources: dict = {}  # jobID: combo that found it, until the application finished
+
+    def add(self, positions, locations) -> None:
+        combos: list = [(position, location) for position in positions for location in locations]
+        random.shuffle(combos)
+        for combo in combos:
+            if combo not in self.stats:
+                self.stats[combo] = {"minutes": 0.0, "jobs": 0, "applied": 0, "runs": 0, "exhausted": False}
+                self.untried.append(combo)
+
+    def active(self) -> list:
+        return [combo for combo, s in self.stats.items() if not s["exhausted"]]
+
+    def yield_rate(self, combo) -> float:
+        s: dict = self.stats[combo]
+        return (s["jobs"] + s["applied"]) / max(s["minutes"], 1.0)
+
+    def next(self):
+        """Combo to search next, or None once every combo is exhausted"""
+        if self.untried:
+            self.current = self.untried.pop()
+            return self.current
+        active: list = self.active()
+        if not active:
+            self.current = None
+            return None
+        total_runs: int = sum(self.stats[combo]["runs"] for combo in active)
+
+        def score(combo) -> float:
+            bonus: float = math.sqrt(2 * math.log(max(total_runs, 1)) / max(self.stats[combo]["runs"], 1))
+            return self.yield_rate(combo) + self.exploration * bonus
+
+        self.current = max(active, key=score)
+        return self.current
+
+    def job_found(self, jobID) -> None:
+        """Remember that the combo being searched found jobID"""
+        with self.lock:
+            if self.current is not None:
+                self.sources[str(jobID)] = self.current
+
+    def application_done(self, jobID, applied) -> None:
+        """Credit a sent application to the combo that found the job"""
+        with self.lock:
+            combo = self.sources.pop(str(jobID), None)
+            if applied and combo is not None:
+                self.stats[combo]["applied"] += 1
+
+    def record(self, combo, minutes, jobs, exhausted) -> None:
+        with self.lock:
+            s: dict = self.stats[combo]
+            s["minutes"] += minutes
+            s["jobs"] += jobs
+            s["runs"] += 1
+            used_up: bool = self.max_minutes is not None and s["minutes"] >= self.max_minutes
+            s["exhausted"] = s["exhausted"] or exhausted or used_up
+
+    def minutes_left(self, combo) -> float:
+        if self.max_minutes is None:
+            return float("inf")
+        return max(self.max_minutes - self.stats[combo]["minutes"], 0.0)
+
+    def summary(self) -> dict:
+        return {f"{position}: {location}": round(self.yield_rate((position, location)), 2)
+                for position, location in self.stats}
+
+
+class QAStore:
+    """Question/answer pairs backed by a Question,Answer CSV file.
+
+    New answers are buffered in memory and written in batches; every flush
+    rewrites the file through a temp file and a rename so a crash can never
+    leave it half written.
+    """
+
+    def __init__(self, path, flush_every=20) -> None:
+        self.path = Path(path)
+        self.flush_every: int = flush_every
+        self.lock = threading.Lock()
+        self.answers: dict = {}
+        self.unflushed: int = 0
+        if self.path.is_file():
+            with open(self.path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self.answers[row["Question"]] = row["Answer"]
+            log.info(f"Loaded {len(self.answers)} answers from {self.path}")
+        else:
+            self.flush(force=True)
+
+    def __contains__(self, question) -> bool:
+        return question in self.answers
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def get(self, question, default=None):
+        return self.answers.get(question, default)
+
+    def add(self, question, answer) -> None:
+        with self.lock:
+            self.answers[question] = answer
+            self.unflushed += 1
+            if self.unflushed < self.flush_every:
+                return
+        self.flush()
+
+    def flush(self, force=False) -> None:
+        with self.lock:
+            if not self.unflushed and not force:
+                return
+            tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(["Question", "Answer"])
+                writer.writerows(self.answers.items())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self.unflushed = 0
+
+
+class QuestionRules:
+    """Answers form questions from an ordered list of rules.
+
+    All rules are compiled into one regex of zero-width lookaheads, so a
+    single scan of the question finds every matching rule and the one listed
+    first wins. Answers are memoized per normalized question. Regex rules
+    must not use backreferences, named groups or global inline flags, which
+    would break once the rules are combined.
+    """
+
+    # Constructs whose meaning changes when a rule is embedded in the combined pattern
+    UNSUPPORTED = re.compile(r"(?<!\\)\\[1-9]|\(\?P[<=]|\(\?[aiLmsux]+\)")
+
+    def __init__(self, rules, variables={}) -> None:
+        self.answers: list = []
+        patterns: list = []
+        for i, rule in enumerate(rules):
+            pattern = rule["regex"] if "regex" in rule else re.escape(str(rule["match"]).lower())
+            if "regex" in rule:
+                self.check(i, pattern)
+            patterns.append(f"(?P<r{i}>{pattern})")
+            self.answers.append(str(rule["answer"]).format_map(variables))
+        self.pattern = re.compile("(?=" + "|".join(patterns) + ")", re.IGNORECASE) if patterns else None
+        self.cache: dict = {}
+
+    @classmethod
+    def check(cls, index, pattern) -> None:
+        """Raise ValueError naming the rule when its regex cannot be used"""
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Question rule {index} has an invalid regex {pattern!r}: {e}")
+        if cls.UNSUPPORTED.search(pattern):
+            raise ValueError(f"Question rule {index} regex {pattern!r} uses a backreference, named group "
+                             f"or global inline flag, which question rules do not support")
+
+    @classmethod
+    def from_file(cls, path, variables={}) -> QuestionRules:
+        try:
+            with open(path, 'r') as stream:
+                rules = yaml.safe_load(stream) or []
+        except FileNotFoundError:
+            log.warning(f"Question rules file {path} not found, questions will not be answered automatically")
+            rules = []
+        log.info(f"Loaded {len(rules)} question rules from {path}")
+        return cls(rules, variables)
+
+    @staticmethod
+    def normalize(question) -> str:
+        return " ".join(question.lower().split())
+
+    def match(self, question) -> str | None:
+        key: str = self.normalize(question)
+        if key in self.cache:
+            return self.cache[key]
+        answer = None
+        if self.pattern is not None:
+            best = None
+            for m in self.pattern.finditer(key):
+                rule = int(m.lastgroup[1:])
+                if best is None or rule < best:
+                    best = rule
+            if best is not None:
+                answer = self.answers[best]
+        self.cache[key] = answer
+        return answer
+
+
+class Diagnostics:
+    """Screenshots and DOM dumps for debugging, kept off the hot path.
+
+    level "off" records nothing, "on-failure" keeps the last few screenshots
+    of each browser in memory and only writes them when an application
+    fails, and "always" writes every screenshot and logs full DOM dumps.
+    Files are decoded and written by a background thread, and the oldest
+    ones are deleted once max_files is reached.
+    """
+
+    def __init__(self, level="on-failure", directory="logs", buffer_size=5, max_files=200) -> None:
+        self.level: str = level
+        self.directory = Path(directory)
+        self.buffer_size: int = buffer_size
+        self.max_files: int = max_files
+        self.buffers: dict = {}  # Ring buffer per thread, each worker has its own browser
+        self.files = collections.deque(sorted(self.directory.glob("screenshot_*.png"), key=os.path.getmtime))
+        self.pending: queue.Queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name="diagnostics-writer", daemon=True)
+        if self.level != "off":
+            self.writer.start()
+
+    @property
+    def dom_dumps(self) -> bool:
+        return self.level == "always"
+
+    def buffer(self) -> collections.deque:
+        return self.buffers.setdefault(threading.get_ident(), collections.deque(maxlen=self.buffer_size))
+
+    def capture(self, browser, label) -> None:
+        if self.level == "off":
+            return
+        try:
+            data: str = browser.get_screenshot_as_base64()
+        except Exception as e:
+            log.debug(f"Failed to capture {label} screenshot: {e}")
+            return
+        name: str = f"screenshot_{label}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+        if self.level == "always":
+            self.pending.put((name, data))
+        else:
+            self.buffer().append((name, data))
+
+    def start_job(self) -> None:
+        self.buffer().clear()
+
+    def job_failed(self, jobID) -> None:
+        buffer = self.buffer()
+        if buffer:
+            log.info(f"Saving {len(buffer)} screenshots of failed application {jobID}")
+        while buffer:
+            name, data = buffer.popleft()
+            self.pending.put((f"screenshot_{jobID}_{name[len('screenshot_'):]}", data))
+
+    def write_loop(self) -> None:
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            name, data = item
+            try:
+                self.directory.mkdir(exist_ok=True)
+                path = self.directory / name
+                path.write_bytes(base64.b64decode(data))
+                self.files.append(path)
+                while len(self.files) > self.max_files:
+                    self.files.popleft().unlink(missing_ok=True)
+            except Exception as e:
+                log.debug(f"Failed to write screenshot {name}: {e}")
+
+    def close(self) -> None:
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+
+
+class ModalLocationCache:
+    """Remembers where the Easy Apply modal was found and checks there first.
+
+    A strategy is ("light", None), ("shadow", host selector) or ("iframe",
+    index). Hits and misses are counted per strategy; on a miss the caller
+    falls back to the full probe and teaches the cache its result.
+    """
+
+    MODAL_SELECTOR: str = "div[role='dialog'], .jobs-easy-apply-modal, div[data-test-modal]"
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.strategies: list = []  # Most recently successful first
+        self.stats: dict = collections.defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    def check(self, bot, strategy) -> bool:
+        kind, target = strategy
+        if kind == "light":
+            return bot.browser.execute_script(
+                "return !!document.querySelector(arguments[0]);", self.MODAL_SELECTOR)
+        if kind == "shadow":
+            return bot.browser.execute_script(
+                "var host = document.querySelector(arguments[0]);"
+                "return !!(host && host.shadowRoot && host.shadowRoot.querySelector(arguments[1]));",
+                target, self.MODAL_SELECTOR)
+        iframes = bot.browser.find_elements(By.TAG_NAME, "iframe")
+        if target >= len(iframes):
+            return False
+        try:
+            bot.browser.switch_to.frame(iframes[target])
+            return len(bot.browser.find_elements(By.CSS_SELECTOR, self.MODAL_SELECTOR)) > 0
+        finally:
+            bot.browser.switch_to.default_content()
+
+    def locate(self, bot):
+        """Strategy that finds the modal on the current page, or None on a miss"""
+        with self.lock:
+            strategies = list(self.strategies)
+        if not strategies:
+            return None
+        start: float = time.time()
+        deadline: float = start + bot.budget.timeout("modal_cache")
+        while time.time() < deadline:
+            for strategy in strategies:
+                try:
+                    found: bool = self.check(bot, strategy)
+                except Exception as e:
+                    log.debug(f"Modal check {strategy} failed: {e}")
+                    found = False
+                if found:
+                    bot.budget.observe("modal_cache", time.time() - start)
+                    self.learn(strategy)
+                    bot.shadow_host_selector = strategy[1] if strategy[0] == "shadow" else None
+                    log.info(f"Modal found with cached strategy {strategy}")
+                    return strategy
+            time.sleep(0.25)
+        with self.lock:
+            for strategy in strategies:
+                self.stats[strategy]["misses"] += 1
+        log.info("Cached modal strategies missed, running the full probe")
+        return None
+
+    def learn(self, strategy) -> None:
+        if strategy is None:
+            return
+        with self.lock:
+            self.stats[strategy]["hits"] += 1
+            if strategy in self.strategies:
+                self.strategies.remove(strategy)
+            self.strategies.insert(0, strategy)
+
+    def hit_rates(self) -> dict:
+        with self.lock:
+            return {f"{kind}:{target}": round(s["hits"] / max(s["hits"] + s["misses"], 1), 2)
+                    for (kind, target), s in self.stats.items()}
+
+
+# Resolves once the DOM has stopped changing for quietMs, or after timeoutMs.
+# Scrolling to the bottom first triggers LinkedIn's lazy-loaded content.
+PAGE_QUIESCENCE_SCRIPT = """
+    var quietMs = arguments[0], timeoutMs = arguments[1];
+    var done = arguments[arguments.length - 1];
+    var start = Date.now(), last = Date.now();
+    var observer = new MutationObserver(function () { last = Date.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    window.scrollTo(0, document.body.scrollHeight);
+    var timer = setInterval(function () {
+        var now = Date.now();
+        if (now - last >= quietMs || now - start >= timeoutMs) {
+            clearInterval(timer);
+            observer.disconnect();
+            window.scrollTo(0, 0);
+            done(now - last >= quietMs);
+        }
+    }, 50);
+"""
+
+
+# Scrolls the search results list step by step so every card renders, then
+# returns one plain dict per job card. LinkedIn keeps an li[data-occludable-job-id]
+# placeholder for every result on the page but only renders the card inside once
+# it scrolled into view, so slots counts the page's results even when a card is
+# still missing. lastPage comes from the pagination control (null when there is
+# none) and noResults from the "no matching jobs" banner.
+HARVEST_CARDS_SCRIPT = """
+    var done = arguments[arguments.length - 1];
+    var list = document.querySelector('.jobs-search-results-list') ||
+               document.querySelector('.scaffold-layout__list > div');
+    function text(card, selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var el = card.querySelector(selectors[i]);
+            if (el && el.innerText.trim()) {
+                return el.innerText.trim().split('\\n')[0];
+            }
+        }
+        return '';
+    }
+    // The "Applied" badge lives in the card footer; the title may contain the word too (Applied Scientist)
+    function applied(card) {
+        return Array.from(card.querySelectorAll('.job-card-container__footer-job-state, ' +
+                                                '.job-card-container__footer-item')).some(function (el) {
+            return /^Applied\\b/.test(el.innerText.trim());
+        });
+    }
+    function collect() {
+        return Array.from(document.querySelectorAll('div[data-job-id]')).map(function (card) {
+            var body = card.innerText || '';
+            return {
+                jobID: card.getAttribute('data-job-id'),
+                title: text(card, ['.job-card-list__title', '.job-card-container__link', 'a[aria-label]', 'strong']),
+                company: text(card, ['.job-card-container__primary-description', '.artdeco-entity-lockup__subtitle',
+                                     '.job-card-container__company-name']),
+                location: text(card, ['.job-card-container__metadata-item', '.artdeco-entity-lockup__caption']),
+                applied: applied(card),
+                text: body
+            };
+        });
+    }
+    function lastPage() {
+        var next = document.querySelector('.jobs-search-pagination__button--next');
+        if (next) {
+            return next.disabled || next.getAttribute('aria-disabled') === 'true';
+        }
+        var pages = document.querySelectorAll('.artdeco-pagination__pages li');
+        if (pages.length) {
+            return pages[pages.length - 1].classList.contains('active') ||
+                   pages[pages.length - 1].classList.contains('selected');
+        }
+        return null;
+    }
+    function finish() {
+        var slots = document.querySelectorAll('li[data-occludable-job-id]').length;
+        var waited = 0;
+        (function settle() {
+            var cards = collect();
+            if (cards.length >= slots || waited >= 2000) {
+                done({
+                    cards: cards,
+                    slots: Math.max(slots, cards.length),
+                    lastPage: lastPage(),
+                    noResults: !!document.querySelector('.jobs-search-no-results-banner, .jobs-search-no-results')
+                });
+            } else {
+                // Late cards render on their own once scrolled past, give them a moment
+                waited += 100;
+                setTimeout(settle, 100);
+            }
+        })();
+    }
+    if (!list) {
+        finish();
+        return;
+    }
+    var y = 0;
+    (function step() {
+        list.scrollTo(0, y);
+        y += 300;
+        if (y <= list.scrollHeight) {
+            setTimeout(step, 30);
+        } else {
+            finish();
+        }
+    })();
+"""
+
+
+class PageSnapshot:
+    """Lazy view of the loaded page.
+
+    Nothing is read from the browser until a consumer asks, and then only the
+    answer to that question crosses the wire, never the full page source.
+    """
+
+    def __init__(self, browser, ready=True) -> None:
+        self.browser = browser
+        self.ready: bool = ready  # False when the wait for the page timed out
+
+    def contains(self, needle) -> bool:
+        """Whether the visible text of the page contains needle"""
+        return bool(self.browser.execute_script(
+            "return document.body.innerText.indexOf(arguments[0]) !== -1;", needle))
+
+
+class WaitBudget:
+    """Timeouts derived from how long each wait target actually takes.
+
+    Every successful wait is recorded per target, and the timeout becomes
+    the p99 of the recent latencies times factor, clamped to [minimum,
+    maximum]. Targets with too few samples use their default. Each thread
+    can also run under an application deadline that caps all timeouts.
+    """
+
+    DEFAULTS: dict = {
+        "login_fields": 30,
+        "login_button": 30,
+        "login_redirect": 30,
+        "page_ready": 10,
+        "easy_apply_button": 2,
+        "modal": 10,
+        "modal_cache": 5,
+        "step_transition": 5,
+    }
+
+    def __init__(self, factor=2.0, minimum=1.0, maximum=30.0, window=50, min_samples=5,
+                 application_budget=None) -> None:
+        self.factor: float = factor
+        self.minimum: float = minimum
+        self.maximum: float = maximum
+        self.window: int = window
+        self.min_samples: int = min_samples
+        self.application_budget = application_budget
+        self.lock = threading.Lock()
+        self.samples: dict = {}
+        self.local = threading.local()  # Application deadline of the current thread
+
+    def observe(self, target, seconds) -> None:
+        with self.lock:
+            self.samples.setdefault(target, collections.deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, target, q=0.99) -> float | None:
+        with self.lock:
+            samples = sorted(self.samples.get(target, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def timeout(self, target) -> float:
+        p99 = self.percentile(target)
+        if p99 is None:
+            timeout = self.DEFAULTS.get(target, self.maximum)
+        else:
+            timeout = min(max(p99 * self.factor, self.minimum), self.maximum)
+        remaining = self.remaining()
+        if remaining is not None:
+            timeout = min(timeout, max(remaining, 0.5))
+        return timeout
+
+    def start_application(self) -> None:
+        self.local.deadline = time.time() + self.application_budget if self.application_budget else None
+
+    def end_application(self) -> None:
+        self.local.deadline = None
+
+    def remaining(self) -> float | None:
+        deadline = getattr(self.local, "deadline", None)
+        return deadline - time.time() if deadline is not None else None
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def summary(self) -> dict:
+        with self.lock:
+            targets = list(self.samples)
+        return {target: round(self.timeout(target), 2) for target in targets}
+
+
+class SelectorRegistry:
+    """Ranked locator strategies for each logical page element.
+
+    Strategies are reordered by hit rate and then by latency as the bot runs,
+    and the statistics are saved to a JSON file so the learned order carries
+    over to the next run. find() waits once for whichever strategy matches
+    first instead of paying a full timeout for every strategy that misses.
+    """
+
+    DEFAULTS: dict = {
+        "login_button": [
+            (By.CSS_SELECTOR, 'button[data-litms-control-urn="login-submit"]'),  # most robust
+            (By.CSS_SELECTOR, 'button.btn__primary--large[type="submit"]'),     # specific by type and class
+            (By.XPATH, '//button[contains(text(), "Sign in")]'),               # fallback: visible text
+            (By.CSS_SELECTOR, 'button[type="submit"]'),                        # generic fallback
+        ],
+        "easy_apply_button": [
+            (By.XPATH, '//button[contains(@aria-label, "Easy Apply") and contains(@class, "jobs-apply-button")]'),
+            (By.XPATH, '//a[contains(@data-view-name, "job-apply-button") and contains(.//span, "Easy Apply")]'),
+        ],
+        "modal": [
+            (By.CSS_SELECTOR, "div[role='dialog']"),
+            (By.CSS_SELECTOR, ".jobs-easy-apply-modal"),
+            (By.CSS_SELECTOR, "div[data-test-modal]"),
+        ],
+        # Resolved inside MODAL_STATE_SCRIPT, so these have to be CSS selectors
+        "next": [
+            (By.CSS_SELECTOR, "button[aria-label='Continue to next step']"),
+            (By.CSS_SELECTOR, "button[data-easy-apply-next-button]"),
+        ],
+        "review": [
+            (By.CSS_SELECTOR, "button[aria-label='Review your application']"),
+        ],
+        "submit": [
+            (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
+        ],
+    }
+
+    def __init__(self, path=None) -> None:
+        self.path = Path(path) if path else None
+        self.lock = threading.Lock()
+        self.stats: dict = {}  # {element: {"by=value": {"hits", "misses", "latency"}}}
+        self.timeouts: dict = collections.Counter()
+        if self.path is not None and self.path.is_file():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved: dict = json.load(f)
+            self.stats = {name: {entry["selector"]: {k: entry[k] for k in ("hits", "misses", "latency")}
+                                 for entry in entries}
+                          for name, entries in saved.get("selectors", {}).items()}
+            log.info(f"Loaded selector statistics from {self.path}")
+
+    @staticmethod
+    def key(selector) -> str:
+        return f"{selector[0]}={selector[1]}"
+
+    def ranked(self, name) -> list:
+        defaults: list = self.DEFAULTS[name]
+        with self.lock:
+            stats: dict = self.stats.get(name, {})
+
+            def score(item):
+                i, selector = item
+                s = stats.get(self.key(selector), {"hits": 0, "misses": 0, "latency": 0.0})
+                hit_rate = (s["hits"] + 1) / (s["hits"] + s["misses"] + 2)
+                return (-hit_rate, s["latency"], i)
+
+            return [selector for _, selector in sorted(enumerate(defaults), key=score)]
+
+    def record(self, name, selector, found, latency=0.0) -> None:
+        with self.lock:
+            s = self.stats.setdefault(name, {}).setdefault(self.key(selector),
+                                                            {"hits": 0, "misses": 0, "latency": 0.0})
+            if found:
+                s["hits"] += 1
+                # Running mean of the time it took to find the element
+                s["latency"] += (latency - s["latency"]) / s["hits"]
+            else:
+                s["misses"] += 1
+
+    def record_match(self, name, selector, ranked=None, latency=0.0) -> None:
+        """Count a hit for the matching strategy and a miss for every strategy ranked above it"""
+        ranked = ranked if ranked is not None else self.ranked(name)
+        for other in ranked:
+            if other == selector:
+                break
+            self.record(name, other, False)
+        self.record(name, selector, True, latency)
+
+    def css(self, name) -> list:
+        return [selector[1] for selector in self.ranked(name) if selector[0] == By.CSS_SELECTOR]
+
+    def find(self, browser, name, timeout=10, clickable=False, text=None):
+        """First element matched by any strategy for name, or None after timeout"""
+        ranked: list = self.ranked(name)
+        start: float = time.time()
+
+        def match(driver):
+            for selector in ranked:
+                for element in driver.find_elements(*selector):
+                    if text is not None and text not in element.text:
+                        continue
+                    if clickable and not (element.is_displayed() and element.is_enabled()):
+                        continue
+                    return selector, element
+            return False
+
+        try:
+            selector, element = WebDriverWait(browser, timeout, poll_frequency=0.25).until(match)
+        except TimeoutException:
+            with self.lock:
+                self.timeouts[name] += 1
+            log.debug(f"No strategy found {name} within {timeout}s")
+            return None
+        self.record_match(name, selector, ranked, time.time() - start)
+        return element
+
+    def telemetry(self) -> dict:
+        telemetry: dict = {}
+        for name in self.DEFAULTS:
+            with self.lock:
+                stats: dict = dict(self.stats.get(name, {}))
+            telemetry[name] = [dict(selector=self.key(selector),
+                                    **stats.get(self.key(selector), {"hits": 0, "misses": 0, "latency": 0.0}))
+                               for selector in self.ranked(name)]
+        return telemetry
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self.lock:
+            timeouts = dict(self.timeouts)
+        data: dict = {"selectors": self.telemetry(), "timeouts": timeouts}
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+class FormState:
+    """Steps of the Easy Apply form as seen by send_resume"""
+
+    CONTACT_INFO = "contact info"
+    RESUME = "resume"
+    QUESTIONS = "questions"
+    REVIEW = "review"
+    SUBMITTED = "submitted"
+    CLOSED = "closed"
+    STUCK = "stuck"
+
+
+# Reads everything send_resume needs about the current Easy Apply step from
+# the document and the shadow root of arguments[0]. arguments[1] holds the
+# ranked selectors for next, review and submit. Buttons and inputs are
+# returned as elements, only visible ones count.
+MODAL_STATE_SCRIPT = """
+    var roots = [document];
+    var host = document.querySelector(arguments[0]);
+    if (host && host.shadowRoot) {
+        roots.push(host.shadowRoot);
+    }
+    function visible(el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+    function all(selector, scopes) {
+        var found = [];
+        scopes.forEach(function (scope) {
+            found = found.concat(Array.from(scope.querySelectorAll(selector)));
+        });
+        return found;
+    }
+    var matched = {};
+    function first(selectors, scopes, mustBeVisible, name) {
+        for (var i = 0; i < selectors.length; i++) {
+            var els = all(selectors[i], scopes).filter(function (el) { return !mustBeVisible || visible(el); });
+            if (els.length) {
+                if (name) {
+                    matched[name] = selectors[i];
+                }
+                return els[0];
+            }
+        }
+        return null;
+    }
+    var ranked = arguments[1];
+    var modal = first(['.jobs-easy-apply-modal', 'div[data-test-modal]', "div[role='dialog']"], roots, true);
+    var scopes = modal ? [modal] : roots;
+    var next = first(ranked.next, scopes, true, 'next');
+    if (!next) {
+        next = all('button', scopes).filter(function (btn) {
+            var label = (btn.getAttribute('aria-label') || btn.textContent || '').trim().toLowerCase();
+            return visible(btn) && (label.indexOf('next') === 0 || label.indexOf('continue') === 0);
+        })[0] || null;
+    }
+    // Last resort for an unlabelled step button: the last primary button of the modal
+    var primary = modal ? all('button.artdeco-button--primary', [modal]).filter(visible).pop() || null : null;
+    var progress = first(['progress', "[role='progressbar']"], scopes, false);
+    var value = progress ? (progress.getAttribute('aria-valuenow') || progress.getAttribute('value')) : null;
+    var heading = first(['h3', 'h2'], scopes, true);
+    return {
+        modal: !!modal,
+        sent: /application was sent/i.test(document.body.innerText),
+        submit: first(ranked.submit, scopes, true, 'submit'),
+        review: first(ranked.review, scopes, true, 'review'),
+        next: next,
+        primary: primary,
+        follow: first(["label[for='follow-company-checkbox']"], scopes, true),
+        errors: all('.artdeco-inline-feedback__message', scopes).filter(visible).map(function (el) {
+            return el.textContent.trim();
+        }),
+        upload_resume: first(["input[id*='jobs-document-upload-file-input-upload-resume']"], scopes, false),
+        upload_cv: first(["input[id*='jobs-document-upload-file-input-upload-cover-letter']"], scopes, false),
+        progress: value === null ? null : Math.round(parseFloat(value)),
+        heading: heading ? heading.textContent.trim() : '',
+        matched: matched
+    };
+"""
+
+
 class EasyApplyBot:
-    setupLogger()
-    # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
+    # Total time one (position, location) search may take in a run, one hour by default
     MAX_SEARCH_TIME = 60 * 60
+    # A search runs this long before the scheduler decides again which search comes next
+    SEARCH_SLICE = 10 * 60
+    # LinkedIn shows this many job cards per search results page
+    RESULTS_PER_PAGE = 25
 
     def __init__(self,
                  username,
                  password,
                  phone_number,
-                 # profile_path,
                  salary,
                  rate,
                  uploads={},
                  filename='output.csv',
                  blacklist=[],
                  blackListTitles=[],
-                 experience_level=[]
+                 include_titles=[],
+                 include_locations=[],
+                 experience_level=[],
+                 ledger_file=None,
+                 retention_days=2,
+                 page_load_mode="event",
+                 workers=1,
+                 rate_limits={},
+                 daily_quota={},
+                 jitter={},
+                 governor_state_file='rate_governor.json',
+                 cursor_file='search_cursors.json',
+                 max_stale_pages=2,
+                 max_run_minutes=None,
+                 pipeline=False,
+                 queue_size=100,
+                 queue_file=None,
+                 rules_file='qa_rules.yaml',
+                 unanswered_questions='defer',
+                 parked_file='parked_applications.json',
+                 pending_questions_file='pending_questions.csv',
+                 qa_file='qa.csv',
+                 qa_flush_every=20,
+                 output_format='csv',
+                 chromedriver_path=None,
+                 chromedriver_cache='.chromedriver_path',
+                 profile_path=None,
+                 session_file='linkedin_session.json',
+                 browser_mode='normal',
+                 network_filter=False,
+                 block_url_patterns=None,
+                 block_resource_types=[],
+                 cache_dir=None,
+                 diagnostics='on-failure',
+                 diagnostics_max_files=200,
+                 max_form_steps=15,
+                 selectors_file='selector_stats.json',
+                 wait_factor=2.0,
+                 application_budget=180
                  ) -> None:
 
         log.info("Welcome to Easy Apply Bot")
@@ -89,26 +1544,42 @@ class EasyApplyBot:
         self.uploads = uploads
         self.salary = salary
         self.rate = rate
-        # self.profile_path = profile_path
-        past_ids: list | None = self.get_appliedIDs(filename)
-        self.appliedJobIDs: list = past_ids if past_ids != None else []
+        self.profile_path = profile_path
+        self.session_file = Path(session_file) if session_file else None
+        self.browser_mode: str = browser_mode
+        self.cache_dir: str | None = cache_dir
+        self.network_filter = NetworkFilter(block_url_patterns, block_resource_types) if network_filter else None
         self.filename: str = filename
+        ledger_file = ledger_file if ledger_file else Path(filename).with_suffix('.db')
+        self.ledger = JobLedger(ledger_file, retention_days=retention_days, seed_csv=filename)
+        self.page_load_mode: str = page_load_mode
+        # The ledger always records results, output_format: sqlite skips the CSV copy
+        self.output = OutputWriter(filename) if output_format == "csv" else None
+        if self.output is not None:
+            atexit.register(self.output.close)
+        self.governor = RateGovernor(rate_limits, daily_quota, jitter, governor_state_file)
+        self.budget = WaitBudget(factor=wait_factor, application_budget=application_budget)
         self.options = self.browser_options()
-        self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
-        self.wait = WebDriverWait(self.browser, 30)
+        self.driver_path: str | None = chromedriver_path
+        self.driver_pinned: bool = chromedriver_path is not None  # Never replace a configured driver
+        self.driver_cache: str = chromedriver_cache
+        self.browser = self.create_browser()
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
+        self.card_filter = CardFilter(blacklist, blackListTitles, include_titles, include_locations)
+        self.session_seen = SessionSeen()
+        self.selectors = SelectorRegistry(selectors_file)
+        atexit.register(self.selectors.save)
         self.start_linkedin(username, password)
         self.phone_number = phone_number
         self.experience_level = experience_level
         self.shadow_host_selector = None  # Will store the shadow host selector where modal is found
+        self.modal_cache = ModalLocationCache()
+        self.diagnostics = Diagnostics(diagnostics, max_files=diagnostics_max_files)
+        self.max_form_steps: int = max_form_steps
 
 
         self.locator = {
-            "next": (By.CSS_SELECTOR, "button[aria-label='Continue to next step']"),
-            "next_generic": (By.XPATH, "//button[contains(text(), 'Next')]"),  # Generic Next button by text
-            "review": (By.CSS_SELECTOR, "button[aria-label='Review your application']"),
-            "submit": (By.CSS_SELECTOR, "button[aria-label='Submit application']"),
             "error": (By.CLASS_NAME, "artdeco-inline-feedback__message"),
             "upload_resume": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]"),
             "upload_cv": (By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]"),
@@ -121,46 +1592,95 @@ class EasyApplyBot:
             "multi_select": (By.XPATH, "//*[contains(@id, 'text-entity-list-form-component')]"),
             "text_select": (By.CLASS_NAME, "artdeco-text-input--input"),
             "2fa_oneClick": (By.ID, 'reset-password-submit-button'),
-            "easy_apply_button": (By.XPATH, '//button[contains(@aria-label, "Easy Apply") and contains(@class, "jobs-apply-button")]'),
-            "easy_apply_button_a": (By.XPATH, '//a[contains(@data-view-name, "job-apply-button") and contains(.//span, "Easy Apply")]'),
 
         }
 
-        #initialize questions and answers file
-        self.qa_file = Path("qa.csv")
-        self.answers = {}
-
-        #if qa file does not exist, create it
-        if self.qa_file.is_file():
-            df = pd.read_csv(self.qa_file)
-            for index, row in df.iterrows():
-                self.answers[row['Question']] = row['Answer']
-        #if qa file does exist, load it
-        else:
-            df = pd.DataFrame(columns=["Question", "Answer"])
-            df.to_csv(self.qa_file, index=False, encoding='utf-8')
-
+        self.rules = QuestionRules.from_file(rules_file, {"salary": salary, "rate": rate,
+                                                          "phone_number": phone_number})
+
+        # 'defer' parks applications with unknown questions, 'wait' pauses for a manual answer
+        self.unanswered_questions: str = unanswered_questions
+        self.parked = ParkedApplications(parked_file, pending_questions_file)
+        self.cursors = SearchCursors(cursor_file)
+        # Consecutive result pages without a single unseen job before a search is abandoned
+        self.max_stale_pages: int = max_stale_pages
+        self.scheduler = ComboScheduler(max_minutes=self.MAX_SEARCH_TIME / 60)
+        self.run_deadline = max_run_minutes * 60 if max_run_minutes else None
+        self.form_answers: dict = {}
+
+        #initialize questions and answers file, it is created if it does not exist yet
+        self.answers = QAStore(qa_file, flush_every=qa_flush_every)
+        atexit.register(self.answers.flush)
+
+        # In pipeline mode the search crawl only enqueues jobs and at least one
+        # separate browser applies to them, so the crawl never waits on an application
+        self.pipeline: bool = pipeline
+        self.pool = None
+        if workers > 1 or pipeline:
+            queue_file = queue_file if queue_file else Path(filename).with_suffix('.queue.db')
+            jobs = PersistentJobQueue(queue_file, maxsize=queue_size)
+            self.pool = ApplyWorkerPool(self, max(workers, 1), jobs)
+
+    def wait_until(self, target, condition):
+        """WebDriverWait with the adaptive timeout of target, raises TimeoutException"""
+        start: float = time.time()
+        timeout: float = self.budget.timeout(target)
+        try:
+            result = WebDriverWait(self.browser, timeout).until(condition)
+        except TimeoutException:
+            # A miss counts as a sample at the timeout, so a timeout that fell too low grows back
+            self.budget.observe(target, timeout)
+            raise
+        self.budget.observe(target, time.time() - start)
+        return result
 
-    def get_appliedIDs(self, filename) -> list | None:
+    def find(self, name, **kwargs):
+        """Element for a selector registry entry, waiting at most its adaptive timeout"""
+        start: float = time.time()
+        element = self.selectors.find(self.browser, name, timeout=self.budget.timeout(name), **kwargs)
+        if element is not None:
+            self.budget.observe(name, time.time() - start)
+        return element
+
+    def create_browser(self):
+        if self.driver_path is None:
+            self.driver_path = resolve_chromedriver(self.driver_cache)
         try:
-            df = pd.read_csv(filename,
-                             header=None,
-                             names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
-                             lineterminator='\n',
-                             encoding='utf-8')
-
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
-            df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
-            log.info(f"{len(jobIDs)} jobIDs found")
-            return jobIDs
-        except Exception as e:
-            log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
-            return None
+            browser = webdriver.Chrome(service=ChromeService(self.driver_path), options=self.options)
+        except SessionNotCreatedException as e:
+            if self.driver_pinned:
+                raise
+            # Usually Chrome updated itself and the cached driver is for the old version
+            log.warning(f"Cached chromedriver could not start Chrome, reinstalling: {e.msg}")
+            self.driver_path = resolve_chromedriver(self.driver_cache, refresh=True)
+            browser = webdriver.Chrome(service=ChromeService(self.driver_path), options=self.options)
+        if self.network_filter is not None:
+            self.network_filter.install(browser)
+        return browser
+
+    def clone_with_new_browser(self, index=0):
+        """Copy of the bot driving its own Chrome session, logged in with our cookies"""
+        worker = copy.copy(self)
+        worker.pool = None
+        worker.options = self.browser_options(use_profile=False, cache_name=f"worker-{index}")
+        worker.shadow_host_selector = None
+        worker.browser = worker.create_browser()
+        # Cookies can only be set for the domain that is currently loaded
+        worker.browser.get("https://www.linkedin.com")
+        for cookie in self.browser.get_cookies():
+            cookie.pop("sameSite", None)
+            try:
+                worker.browser.add_cookie(cookie)
+            except Exception as e:
+                log.debug(f"Could not copy cookie {cookie.get('name')}: {e}")
+        return worker
 
-    def browser_options(self):
+    def browser_options(self, use_profile=True, cache_name="main"):
         options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
+        if self.browser_mode == "lean":
+            self.lean_options(options)
+        else:
+            options.add_argument("--start-maximized")
         options.add_argument("--ignore-certificate-errors")
         options.add_argument('--no-sandbox')
         options.add_argument("--disable-extensions")
@@ -171,17 +1691,101 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features")
         options.add_argument("--disable-blink-features=AutomationControlled")
 
-        # Load user profile
-        #options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+        # A fixed cache directory per browser keeps static bundles between sessions
+        if self.cache_dir:
+            options.add_argument(r"--disk-cache-dir={}".format(os.path.abspath(os.path.join(self.cache_dir, cache_name))))
+
+        # Load user profile, Chrome cannot share one between browsers so workers never use it
+        if use_profile and self.profile_path:
+            options.add_argument(r"--user-data-dir={}".format(self.profile_path))
         return options
 
+    def lean_options(self, options) -> None:
+        """Headless Chrome without images, fonts, media or background work"""
+        options.add_argument("--headless=new")
+        # Wide enough for LinkedIn's desktop layout, which is where the Easy Apply modal renders
+        options.add_argument("--window-size=1280,900")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-remote-fonts")
+        options.add_argument("--mute-audio")
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--no-first-run")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+    def session_is_valid(self) -> bool:
+        """Load the feed and check LinkedIn did not bounce us to a login page"""
+        self.browser.get("https://www.linkedin.com/feed/")
+        url: str = self.browser.current_url
+        return not any(marker in url for marker in ("/login", "/authwall", "/checkpoint", "/uas/"))
+
+    def restore_session(self) -> bool:
+        """Reuse the browser profile or the saved cookies if LinkedIn still accepts them"""
+        if self.profile_path and self.session_is_valid():
+            return True
+        if self.session_file is None or not self.session_file.is_file():
+            return False
+
+        with open(self.session_file, 'r', encoding='utf-8') as f:
+            session: dict = json.load(f)
+        # The li_at cookie carries the login, skip the round trips when it has already expired
+        li_at = next((c for c in session.get("cookies", []) if c.get("name") == "li_at"), None)
+        if li_at is None or li_at.get("expiry", float("inf")) < time.time():
+            log.info("Saved LinkedIn session has expired")
+            return False
+
+        # Cookies and local storage can only be set for the domain that is currently loaded
+        self.browser.get("https://www.linkedin.com")
+        for cookie in session["cookies"]:
+            cookie.pop("sameSite", None)
+            try:
+                self.browser.add_cookie(cookie)
+            except Exception as e:
+                log.debug(f"Could not restore cookie {cookie.get('name')}: {e}")
+        self.browser.execute_script(
+            "for (var key in arguments[0]) { window.localStorage.setItem(key, arguments[0][key]); }",
+            session.get("local_storage", {}))
+        return self.session_is_valid()
+
+    def save_session(self) -> None:
+        if self.session_file is None:
+            return
+        session: dict = {
+            "cookies": self.browser.get_cookies(),
+            "local_storage": self.browser.execute_script("return Object.assign({}, window.localStorage);"),
+        }
+        tmp = self.session_file.with_suffix(self.session_file.suffix + '.tmp')
+        # The cookies log into the account, so only the owner may read the file
+        tmp.unlink(missing_ok=True)
+        with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(tmp, self.session_file)
+        log.info(f"Saved LinkedIn session to {self.session_file}")
+
     def start_linkedin(self, username, password) -> None:
+        try:
+            if self.restore_session():
+                log.info("Reusing saved LinkedIn session, skipping login")
+                return
+        except Exception as e:
+            log.warning(f"Could not restore saved LinkedIn session: {e}")
+
         log.info("Logging in.....Please wait :)  ")
         self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
         try:
             # Wait for username and password fields
-            user_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
-            pw_field = self.wait.until(EC.presence_of_element_located((By.ID, "password")))
+            user_field = self.wait_until("login_fields", EC.presence_of_element_located((By.ID, "username")))
+            pw_field = self.wait_until("login_fields", EC.presence_of_element_located((By.ID, "password")))
 
             # Older selectors retained for future reference:
             # (By.XPATH, '//*[@id="organic-div"]/form/div[3]/button')
@@ -189,20 +1793,8 @@ class EasyApplyBot:
             # (By.XPATH, '//button[contains(text(), "Sign in")]')
             # (By.CSS_SELECTOR, 'button[type="submit"]')
 
-            # Best selectors for the current Sign in button
-            login_button = None
-            login_selectors = [
-                (By.CSS_SELECTOR, 'button[data-litms-control-urn="login-submit"]'),  # most robust
-                (By.CSS_SELECTOR, 'button.btn__primary--large[type="submit"]'),     # specific by type and class
-                (By.XPATH, '//button[contains(text(), "Sign in")]'),               # fallback: visible text
-                (By.CSS_SELECTOR, 'button[type="submit"]'),                        # generic fallback
-            ]
-            for selector in login_selectors:
-                try:
-                    login_button = self.wait.until(EC.element_to_be_clickable(selector))
-                    break
-                except TimeoutException:
-                    continue
+            # Sign in button selectors are ranked by the selector registry
+            login_button = self.find("login_button", clickable=True)
             if login_button is None:
                 raise TimeoutException("Login button not found with any selector!")
 
@@ -212,7 +1804,12 @@ class EasyApplyBot:
             pw_field.send_keys(password)
             time.sleep(1)
             login_button.click()
-            time.sleep(5)  # enough time for redirect/2FA if needed
+            try:
+                # Give the redirect (or a 2FA challenge) time to finish before saving the session
+                self.wait_until("login_redirect", EC.url_contains("/feed"))
+                self.save_session()
+            except TimeoutException:
+                log.warning("Login did not reach the feed, session was not saved")
         except TimeoutException as e:
             log.error(f"TimeoutException! Username/password field or login button not found: {e}")
             raise
@@ -221,104 +1818,189 @@ class EasyApplyBot:
             raise
 
     def fill_data(self) -> None:
+        if self.browser_mode == "lean":
+            return  # Headless, there is no window to hide
         self.browser.set_window_size(1, 1)
         self.browser.set_window_position(2000, 2000)
 
     def start_apply(self, positions, locations) -> None:
         start: float = time.time()
+        deadline: float = start + self.run_deadline if self.run_deadline else float("inf")
         self.fill_data()
         self.positions = positions
         self.locations = locations
-        combos: list = []
-        while len(combos) < len(positions) * len(locations):
-            position = positions[random.randint(0, len(positions) - 1)]
-            location = locations[random.randint(0, len(locations) - 1)]
-            combo: tuple = (position, location)
-            if combo not in combos:
-                combos.append(combo)
+        self.scheduler.add(positions, locations)
+        try:
+            self.resume_parked_applications()
+            while time.time() < deadline:
+                combo = self.scheduler.next()
+                if combo is None:
+                    log.info("Every search ran out of results or search time")
+                    break
+                position, location = combo
                 log.info(f"Applying to {position}: {location}")
-                location = "&location=" + location
-                self.applications_loop(position, location)
-            if len(combos) > 500:
-                break
+                slice_start: float = time.time()
+                time_limit: float = min(self.SEARCH_SLICE, deadline - slice_start,
+                                        self.scheduler.minutes_left(combo) * 60)
+                found, exhausted = self.applications_loop(position, "&location=" + location, time_limit)
+                self.scheduler.record(combo, (time.time() - slice_start) / 60, found, exhausted)
+            else:
+                log.info("Run deadline reached")
+        except DailyQuotaReached as e:
+            log.info(f"{e}, stopping for today")
+        log.info(f"Search yield per minute: {self.scheduler.summary()}")
+        log.info(f"Job cards skipped per filter rule: {self.card_filter.counts()}")
+        log.info(f"{len(self.session_seen)} distinct jobs seen, {self.session_seen.duplicates} duplicate sightings skipped")
+
+        if self.pool is not None:
+            log.info("Search finished, waiting for queued applications")
+            self.pool.join()
+            self.pool.close()
+        self.answers.flush()
+        if self.output is not None:
+            self.output.close()
+        if self.network_filter is not None:
+            log.info(f"Network usage: {self.network_filter.summary()}")
+        log.info(f"Modal location hit rates: {self.modal_cache.hit_rates()}")
+        self.diagnostics.close()
+        self.selectors.save()
+        log.info(f"Selector telemetry: {self.selectors.telemetry()}")
+        log.info(f"Adaptive wait timeouts: {self.budget.summary()}")
 
     # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
 
-    def applications_loop(self, position, location):
+    def applications_loop(self, position, location, time_limit=None):
+        """Search one combo for up to time_limit seconds.
 
-        count_application = 0
-        count_job = 0
-        jobs_per_page = 0
+        Returns the number of new jobs found and whether the search is exhausted.
+        """
+        time_limit = time_limit if time_limit is not None else self.MAX_SEARCH_TIME
+        start: int = self.cursors.get(position, location)
+        stale_pages = 0
+        harvest_failures = 0
+        found = 0
         start_time: float = time.time()
 
         log.info("Looking for jobs.. Please wait..")
 
-        self.browser.set_window_position(1, 1)
-        self.browser.maximize_window()
-        self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level)
+        if self.browser_mode != "lean":
+            self.browser.set_window_position(1, 1)
+            self.browser.maximize_window()
+        if start:
+            log.info(f"Resuming search at result {start}")
+        self.browser, ready = self.next_jobs_page(position, location, start, experience_level=self.experience_level)
         log.info("Looking for jobs.. Please wait..")
 
-        while time.time() - start_time < self.MAX_SEARCH_TIME:
+        while time.time() - start_time < time_limit:
             try:
-                log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
-
-                # sleep to make sure everything loads, add random to make us look human.
-                randoTime: float = random.uniform(1.5, 2.9)
-                log.debug(f"Sleeping for {round(randoTime, 1)}")
-                #time.sleep(randoTime)
-                self.load_page(sleep=0.5)
-
-                # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
-
-                # scroll to bottom
-
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
-                    #     self.browser.find_element(By.CLASS_NAME,
-                    #     "jobs-search-results-list"
-                    # )
-                    # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
-                    #time.sleep(1)
-
-                # get job links, (the following are actually the job card objects)
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                # links = self.browser.find_elements("xpath",
-                #     '//div[@data-job-id]'
-                # )
-
-                    jobIDs = {} #{Job id: processed_status}
-                
-                    # children selector is the container of the job cards on the left
-                    for link in links:
-                            if 'Applied' not in link.text: #checking if applied already
-                                if link.text not in self.blacklist: #checking if blacklisted
-                                    jobID = link.get_attribute("data-job-id")
-                                    if jobID == "search":
-                                        log.debug("Job ID not found, search keyword found instead? {}".format(link.text))
-                                        continue
-                                    else:
-                                        jobIDs[jobID] = "To be processed"
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs)
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
-                else:
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page, 
-                                                                      experience_level=self.experience_level)
-
-
+                log.info(f"{(time_limit - (time.time() - start_time)) // 60} minutes left in this search")
+
+                # next_jobs_page has already waited for the results page to be ready.
+                # LinkedIn displays the search results in a scrollable <div> on the left side, the harvest
+                # script scrolls it to the bottom and reads every job card in a single round trip
+                page = self.harvest_job_cards()
+                if page is not None and not page["cards"] and not page["noResults"] and not ready:
+                    # The results page did not load in time, an empty harvest says nothing about the results
+                    page = None
+                if page is None:
+                    # A failed harvest says nothing about the results, reload the page once then skip it
+                    harvest_failures += 1
+                    if harvest_failures >= 2:
+                        log.warning(f"Could not read the results page at {start}, skipping it")
+                        harvest_failures = 0
+                        start += self.RESULTS_PER_PAGE
+                        self.cursors.set(position, location, start)
+                    self.browser, ready = self.next_jobs_page(position, location, start,
+                                                          experience_level=self.experience_level)
+                    continue
+                harvest_failures = 0
+                cards: list = page["cards"]
+                if page["noResults"] or not page["slots"]:
+                    log.info(f"No more results after {start}, search finished")
+                    self.cursors.set(position, location, 0)
+                    return found, True
+
+                jobIDs = {} #{Job id: processed_status}
+                unseen = 0
+                for card in cards:
+                    jobID = card["jobID"]
+                    if card["applied"]: #checking if applied already
+                        continue
+                    if jobID == "search":
+                        log.debug("Job ID not found, search keyword found instead? {}".format(card["text"]))
+                        continue
+                    if self.ledger.seen(jobID):
+                        log.debug(f"Skipping {jobID}, already in the job ledger")
+                        continue
+                    if not self.session_seen.add(jobID):
+                        log.debug(f"Skipping {jobID}, already met earlier this session")
+                        continue
+                    unseen += 1
+                    if not self.card_filter.accept(card):
+                        continue
+                    self.scheduler.job_found(jobID)
+                    jobIDs[jobID] = "To be processed"
+                found += len(jobIDs)
+                if len(jobIDs) > 0:
+                    self.apply_loop(jobIDs)
+
+                stale_pages = stale_pages + 1 if unseen == 0 else 0
+                last_page: bool = page["lastPage"] if page["lastPage"] is not None \
+                    else page["slots"] < self.RESULTS_PER_PAGE
+                if last_page:
+                    log.info(f"Reached the last results page at {start + page['slots']}, search finished")
+                    self.cursors.set(position, location, 0)
+                    return found, True
+                start += page["slots"]
+                if stale_pages >= self.max_stale_pages:
+                    log.info(f"{stale_pages} pages in a row held only jobs already seen, moving to the next search")
+                    self.cursors.set(position, location, 0)
+                    return found, True
+                self.cursors.set(position, location, start)
+
+                self.browser, ready = self.next_jobs_page(position,
+                                                      location,
+                                                      start,
+                                                      experience_level=self.experience_level)
+
+            except DailyQuotaReached:
+                raise
             except Exception as e:
                 print(e)
+
+        return found, False
+
+    def harvest_job_cards(self) -> dict | None:
+        """Scroll the results list and snapshot every job card in one script call, None when the script failed.
+
+        Returns the cards, the number of result slots on the page, whether the
+        pagination shows the last page (None when unknown) and whether LinkedIn
+        reports no matching jobs.
+        """
+        try:
+            self.browser.set_script_timeout(30)
+            page: dict = self.browser.execute_async_script(HARVEST_CARDS_SCRIPT)
+        except Exception as e:
+            log.warning(f"Job card harvest failed: {e}")
+            return None
+        log.info(f"Harvested {len(page['cards'])} of {page['slots']} job cards")
+        return page
+
     def apply_loop(self, jobIDs):
+        if self.pool is not None:
+            if self.pool.jobs.closed:
+                # The workers stop once a daily quota is used up
+                raise DailyQuotaReached("Apply workers stopped on a daily quota")
+            for jobID in jobIDs:
+                if jobIDs[jobID] == "To be processed" and not self.ledger.seen(jobID):
+                    self.pool.submit(jobID)  # Blocks while the queue is full
+            if not self.pipeline:
+                self.pool.join()
+            return
+
         for jobID in jobIDs:
+            if self.ledger.seen(jobID):
+                continue
             if jobIDs[jobID] == "To be processed":
                 applied = self.apply_to_job(jobID)
                 if applied:
@@ -327,426 +2009,438 @@ class EasyApplyBot:
                     log.info(f"Failed to apply to {jobID}")
                 jobIDs[jobID] == applied
 
-    def apply_to_job(self, jobID):
-        # #self.avoid_lock() # annoying
-
-        # get job page
-        self.get_job_page(jobID)
+    def resume_parked_applications(self) -> None:
+        """Replay parked applications whose pending question has been answered"""
+        for question, answer in self.parked.take_answers().items():
+            self.save_answer(question, answer)
+        ready: list = self.parked.ready(self.answers, self.rules)
+        if ready:
+            log.info(f"Resuming {len(ready)} parked applications")
+        for jobID in ready:
+            # Only unpark once the replay has run, a quota stop or crash keeps the job parked
+            parked: dict = self.parked.jobs[jobID]
+            applied = self.apply_to_job(jobID)
+            if self.parked.jobs.get(jobID) is parked:  # Otherwise it was parked again on a new question
+                self.parked.remove(jobID)
+            log.info(f"{'Applied' if applied else 'Failed to apply'} to parked job {jobID}")
 
-        # let page load
-        time.sleep(1)
+    def apply_to_job(self, jobID):
+        self.form_answers = {}
+        self.diagnostics.start_job()
+        self.budget.start_application()
+        try:
+            # get job page, load_page waits until it is ready
+            self.get_job_page(jobID)
 
-        # get easy apply button
-        button = self.get_easy_apply_button()
+            # get easy apply button
+            button = self.get_easy_apply_button()
 
 
-        # word filter to skip positions not wanted
-        if button is not False:
-            if any(word in self.browser.title for word in blackListTitles):
-                log.info('skipping this application, a blacklisted keyword was found in the job position')
-                string_easy = "* Contains blacklisted keyword"
-                result = False
-            else:
-                string_easy = "* has Easy Apply Button"
-                log.info("Clicking the EASY apply button")
+            # word filter to skip positions not wanted
+            if button is not False:
+                # Jobs restored from the queue or parked list never went through the card filter
+                if self.card_filter.title_blocked(self.browser.title):
+                    log.info('skipping this application, a blacklisted keyword was found in the job position')
+                    string_easy = "* Contains blacklisted keyword"
+                    result = False
+                else:
+                    string_easy = "* has Easy Apply Button"
+                    log.info("Clicking the EASY apply button")
                 
-                # Verify button state before clicking and capture screenshot
-                try:
-                    # Capture screenshot before clicking
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_before = f"logs/screenshot_before_click_{timestamp}.png"
-                    self.browser.save_screenshot(screenshot_before)
-                    log.info(f"Screenshot captured before click: {screenshot_before}")
-                    
-                    log.debug(f"Button state: displayed={button.is_displayed()}, enabled={button.is_enabled()}")
-                    log.debug(f"Button location: {button.location}, size: {button.size}")
-                    log.debug(f"Button classes: {button.get_attribute('class')}")
-                    log.debug(f"Button aria-label: {button.get_attribute('aria-label')}")
-                    log.debug(f"Button text: {button.text}")
+                    # Verify button state before clicking and capture screenshot
+                    try:
+                        # Capture screenshot before clicking
+                        self.diagnostics.capture(self.browser, "before_click")
+
+                        if self.diagnostics.dom_dumps:
+                            log.debug(f"Button state: displayed={button.is_displayed()}, enabled={button.is_enabled()}")
+                            log.debug(f"Button location: {button.location}, size: {button.size}")
+                            log.debug(f"Button classes: {button.get_attribute('class')}")
+                            log.debug(f"Button aria-label: {button.get_attribute('aria-label')}")
+                            log.debug(f"Button text: {button.text}")
                     
-                    if not button.is_displayed():
-                        log.warning("Button is not displayed, scrolling into view")
-                        self.browser.execute_script("arguments[0].scrollIntoView(true);", button)
-                        time.sleep(0.5)
-                except Exception as e:
-                    log.debug(f"Error checking button state: {e}")
+                        if not button.is_displayed():
+                            log.warning("Button is not displayed, scrolling into view")
+                            self.browser.execute_script("arguments[0].scrollIntoView(true);", button)
+                            time.sleep(0.5)
+                    except Exception as e:
+                        log.debug(f"Error checking button state: {e}")
                 
-                # Try multiple click methods
-                clicked = False
-                try:
-                    # Method 1: Native Selenium click
-                    button.click()
-                    clicked = True
-                    log.info("Used native Selenium click")
-                    
-                    # Capture screenshot after successful click
-                    screenshot_after = f"logs/screenshot_after_click_{timestamp}.png"
-                    self.browser.save_screenshot(screenshot_after)
-                    log.info(f"Screenshot captured after click: {screenshot_after}")
-                except Exception as click_error:
-                    log.debug(f"Native click failed: {click_error}")
+                    # Try multiple click methods
+                    clicked = False
                     try:
-                        # Method 2: JavaScript click
-                        self.browser.execute_script('arguments[0].click()', button)
+                        # Method 1: Native Selenium click
+                        button.click()
                         clicked = True
-                        log.info("Used JavaScript click")
-                        
-                        # Capture screenshot after JavaScript click
-                        screenshot_after = f"logs/screenshot_after_click_{timestamp}.png"
-                        self.browser.save_screenshot(screenshot_after)
-                        log.info(f"Screenshot captured after click: {screenshot_after}")
-                    except Exception as js_error:
-                        log.debug(f"JavaScript click failed: {js_error}")
+                        log.info("Used native Selenium click")
+                    
+                        self.diagnostics.capture(self.browser, "after_click")
+                    except Exception as click_error:
+                        log.debug(f"Native click failed: {click_error}")
                         try:
-                            # Method 3: ActionChains click
-                            from selenium.webdriver.common.action_chains import ActionChains
-                            ActionChains(self.browser).move_to_element(button).click().perform()
+                            # Method 2: JavaScript click
+                            self.browser.execute_script('arguments[0].click()', button)
                             clicked = True
-                            log.info("Used ActionChains click")
+                            log.info("Used JavaScript click")
+                        
+                            self.diagnostics.capture(self.browser, "after_click")
+                        except Exception as js_error:
+                            log.debug(f"JavaScript click failed: {js_error}")
+                            try:
+                                # Method 3: ActionChains click
+                                from selenium.webdriver.common.action_chains import ActionChains
+                                ActionChains(self.browser).move_to_element(button).click().perform()
+                                clicked = True
+                                log.info("Used ActionChains click")
                             
-                            # Capture screenshot after ActionChains click
-                            screenshot_after = f"logs/screenshot_after_click_{timestamp}.png"
-                            self.browser.save_screenshot(screenshot_after)
-                            log.info(f"Screenshot captured after click: {screenshot_after}")
-                        except Exception as action_error:
-                            log.error(f"All click methods failed: {action_error}")
+                                self.diagnostics.capture(self.browser, "after_click")
+                            except Exception as action_error:
+                                log.error(f"All click methods failed: {action_error}")
+                
+                    # Capture screenshot after any click attempt or if all methods failed
+                    self.diagnostics.capture(self.browser, "final_state")
                 
-                # Capture screenshot after any click attempt or if all methods failed
-                try:
-                    screenshot_final = f"logs/screenshot_final_state_{timestamp}.png"
-                    self.browser.save_screenshot(screenshot_final)
                     if clicked:
-                        log.info(f"Final screenshot captured: {screenshot_final}")
+                        log.info("Successfully clicked Easy Apply button")
                     else:
-                        log.warning(f"Final screenshot after failed click attempts: {screenshot_final}")
-                except Exception as screenshot_error:
-                    log.debug(f"Failed to capture final screenshot: {screenshot_error}")
-                
-                if clicked:
-                    log.info("Successfully clicked Easy Apply button")
-                else:
-                    log.error("Failed to click Easy Apply button")
-                clicked = True
+                        log.error("Failed to click Easy Apply button")
+                    clicked = True
                 
-                # CRITICAL: Wait for the modal to actually appear using WebDriverWait
-                log.info("Waiting for modal to appear...")
+                    # CRITICAL: Wait for the modal to actually appear using WebDriverWait
+                    log.info("Waiting for modal to appear...")
                 
-                # Check for and dismiss blocking overlays/popups that prevent modal from opening
-                try:
-                    log.info("Checking for blocking overlays/popups...")
+                    # Check for and dismiss blocking overlays/popups that prevent modal from opening
+                    try:
+                        log.info("Checking for blocking overlays/popups...")
                     
-                    # Common overlay selectors on LinkedIn
-                    overlay_selectors = [
-                        "button[aria-label='Dismiss']",
-                        "button.artdeco-modal__dismiss",
-                        ".artdeco-toast",
-                        "button[data-tracking-control-name='dismiss']",
-                        ".msg-overlay-bubble-header__controls button",
-                        # Check for any modal or overlay that might be blocking
-                        "div[role='alert']",
-                        "div.artdeco-overlay",
-                    ]
+                        # Common overlay selectors on LinkedIn
+                        overlay_selectors = [
+                            "button[aria-label='Dismiss']",
+                            "button.artdeco-modal__dismiss",
+                            ".artdeco-toast",
+                            "button[data-tracking-control-name='dismiss']",
+                            ".msg-overlay-bubble-header__controls button",
+                            # Check for any modal or overlay that might be blocking
+                            "div[role='alert']",
+                            "div.artdeco-overlay",
+                        ]
                     
-                    for overlay_selector in overlay_selectors:
-                        try:
-                            overlays = self.browser.find_elements(By.CSS_SELECTOR, overlay_selector)
-                            if overlays:
-                                log.info(f"Found {len(overlays)} overlay element(s) with selector: {overlay_selector}")
-                                for overlay in overlays:
-                                    if overlay.is_displayed():
-                                        try:
-                                            overlay.click()
-                                            log.info("Dismissed blocking overlay")
-                                            time.sleep(0.5)
-                                        except:
-                                            log.debug("Could not click overlay, trying JavaScript click")
+                        for overlay_selector in overlay_selectors:
+                            try:
+                                overlays = self.browser.find_elements(By.CSS_SELECTOR, overlay_selector)
+                                if overlays:
+                                    log.info(f"Found {len(overlays)} overlay element(s) with selector: {overlay_selector}")
+                                    for overlay in overlays:
+                                        if overlay.is_displayed():
                                             try:
-                                                self.browser.execute_script('arguments[0].click()', overlay)
-                                                log.info("Dismissed blocking overlay via JavaScript")
+                                                overlay.click()
+                                                log.info("Dismissed blocking overlay")
                                                 time.sleep(0.5)
                                             except:
-                                                log.debug("Failed to dismiss overlay")
-                        except Exception as overlay_error:
-                            log.debug(f"Error checking overlay selector {overlay_selector}: {overlay_error}")
+                                                log.debug("Could not click overlay, trying JavaScript click")
+                                                try:
+                                                    self.browser.execute_script('arguments[0].click()', overlay)
+                                                    log.info("Dismissed blocking overlay via JavaScript")
+                                                    time.sleep(0.5)
+                                                except:
+                                                    log.debug("Failed to dismiss overlay")
+                            except Exception as overlay_error:
+                                log.debug(f"Error checking overlay selector {overlay_selector}: {overlay_error}")
                     
-                    # Check for ESC key-needed popups or notifications
-                    try:
-                        # Press ESC to dismiss any keyboard-trapped overlays
-                        from selenium.webdriver.common.keys import Keys
-                        self.browser.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                        log.debug("Pressed ESC to dismiss any overlays")
-                        time.sleep(0.5)
-                    except:
-                        pass
-                        
-                except Exception as e:
-                    log.debug(f"Error during overlay check: {e}")
-                
-                # Try to wait for modal appearance using WebDriverWait
-                modal_wait = WebDriverWait(self.browser, 10)
-                modal_detected_via_wait = False
-                modal_selectors = [
-                    (By.CSS_SELECTOR, "div[role='dialog']"),
-                    (By.CSS_SELECTOR, ".jobs-easy-apply-modal"),
-                    (By.CSS_SELECTOR, "div[data-test-modal]")
-                ]
-                
-                for selector in modal_selectors:
-                    try:
-                        element = modal_wait.until(EC.presence_of_element_located(selector))
-                        if element:
-                            log.info(f"Modal detected via WebDriverWait with selector: {selector[1]}")
-                            modal_detected_via_wait = True
-                            break
-                    except TimeoutException:
-                        log.debug(f"Timeout waiting for modal with selector: {selector[1]}")
-                        continue
-                
-                if not modal_detected_via_wait:
-                    log.warning("Modal not detected via WebDriverWait, checking manually...")
-                    time.sleep(2)  # Fallback sleep
-                
-                # Check for shadow DOM - this is where LinkedIn renders the modal
-                log.info("Checking for Shadow DOM...")
-                shadow_hosts = self.find_all_shadow_hosts()
-                
-                # Try common shadow host locations
-                common_shadow_selectors = [
-                    "div[id='interop-outlet']",
-                    "div[data-testid='interop-outlet']",
-                    "#interop-outlet"
-                ]
-                
-                modal_in_shadow_dom = False
-                for selector in common_shadow_selectors:
-                    try:
-                        log.info(f"Checking shadow host: {selector}")
-                        dialogs_in_shadow = self.find_in_shadow_dom(selector, "div[role='dialog']")
-                        modals_in_shadow = self.find_in_shadow_dom(selector, ".jobs-easy-apply-modal")
-                        modal_data_in_shadow = self.find_in_shadow_dom(selector, "div[data-test-modal]")
-                        
-                        if dialogs_in_shadow or modals_in_shadow or modal_data_in_shadow:
-                            log.info(f"*** MODAL FOUND IN SHADOW DOM at {selector}! ***")
-                            modal_in_shadow_dom = True
-                            self.shadow_host_selector = selector  # Store for later use
-                            break
+                        # Check for ESC key-needed popups or notifications
+                        try:
+                            # Press ESC to dismiss any keyboard-trapped overlays
+                            from selenium.webdriver.common.keys import Keys
+                            self.browser.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                            log.debug("Pressed ESC to dismiss any overlays")
+                            time.sleep(0.5)
+                        except:
+                            pass
                         
-                        # Additional check: Look for buttons in shadow DOM
-                        buttons_in_shadow = self.find_in_shadow_dom(selector, "button")
-                        if buttons_in_shadow:
-                            log.info(f"Found {len(buttons_in_shadow)} buttons in shadow DOM at {selector}")
-                            for btn in buttons_in_shadow[:5]:  # Check first 5 buttons
-                                try:
-                                    btn_text = self.browser.execute_script('return arguments[0].textContent', btn)
-                                    btn_aria = self.browser.execute_script('return arguments[0].getAttribute("aria-label")', btn)
-                                    log.info(f"  Shadow button: text='{btn_text.strip()[:50]}', aria-label='{btn_aria}'")
-                                except:
-                                    pass
-                            # If we found buttons but not a modal, maybe the modal is inside a nested structure
-                            # Try looking for any div that might be a modal container
-                            all_divs = self.browser.execute_script("""
-                                var shadowHost = arguments[0];
-                                var shadowRoot = shadowHost.shadowRoot;
-                                if (shadowRoot) {
-                                    return Array.from(shadowRoot.querySelectorAll('div'));
-                                }
-                                return [];
-                            """, self.browser.find_element(By.CSS_SELECTOR, selector))
-                            log.info(f"Found {len(all_divs)} divs in shadow DOM")
-                            
                     except Exception as e:
-                        log.debug(f"Error checking {selector}: {e}")
-                
-                # Additional wait for page to fully load (reduced from 5 to 1 second since we already used WebDriverWait)
-                time.sleep(1)
+                        log.debug(f"Error during overlay check: {e}")
                 
-                # Check for modal presence with better detection
-                modal_detected = False
-                dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
-                log.info(f"Found {len(dialogs)} dialog elements")
+                    # Try the strategy that found the modal last time before the full probe
+                    strategy = self.modal_cache.locate(self)
+                    if strategy is None:
+                        strategy = self.probe_modal_location()
+                        self.modal_cache.learn(strategy)
+                    modal_present: bool = strategy is not None
+
+                    if not modal_present:
+                        log.warning("Modal not detected after waiting, proceeding anyway")
+                        log.info("Proceeding to fill out fields...")
                 
-                # Also check for the specific modal classes
-                try:
-                    modal_by_class = self.browser.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-modal")
-                    log.info(f"Found {len(modal_by_class)} elements with .jobs-easy-apply-modal class")
-                    if modal_by_class:
-                        for modal in modal_by_class:
-                            is_displayed = modal.is_displayed()
-                            log.info(f"Modal: displayed={is_displayed}, visible={modal.get_attribute('style')}")
-                            if is_displayed:
-                                modal_detected = True
-                except Exception as e:
-                    log.debug(f"Error checking modal by class: {e}")
-                
-                # Check for the specific data attribute
+                    self.fill_out_fields()
+                    try:
+                        result: bool = self.send_resume()
+                    except QuestionDeferred as e:
+                        self.parked.park(jobID, e.question, self.form_answers)
+                        log.info(f"Parked {jobID} until the question is answered in {self.parked.questions_path}")
+                        result = False
+                        string_easy = "* Parked: waiting for an answer"
+                    else:
+                        if result:
+                            string_easy = "*Applied: Sent Resume"
+                        else:
+                            string_easy = "*Did not apply: Failed to send Resume"
+            elif self.job_page.contains("You applied on"):
+                log.info("You have already applied to this position.")
+                string_easy = "* Already Applied"
+                result = False
+            else:
+                log.info("The Easy apply button does not exist.")
+                string_easy = "* Doesn't have Easy Apply Button"
+                result = False
+
+
+            # position_number: str = str(count_job + jobs_per_page)
+            log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
+
+            self.scheduler.application_done(jobID, result)
+            if button is not False and not result:
+                self.diagnostics.job_failed(jobID)
+            self.write_to_file(button, jobID, self.browser.title, result)
+            return result
+        finally:
+            # Waits after this application, such as the next search page, are not capped by its budget
+            self.budget.end_application()
+
+    def probe_modal_location(self):
+        """Full sweep of the light DOM, shadow hosts and iframes for the Easy Apply modal.
+
+        Returns the strategy that found it, ("light", None), ("shadow", host selector)
+        or ("iframe", index), or None when the modal was not found.
+        """
+        # Try to wait for modal appearance using WebDriverWait
+        modal_detected_via_wait = self.find("modal") is not None
+        if modal_detected_via_wait:
+            log.info("Modal detected via WebDriverWait")
+
+        if not modal_detected_via_wait:
+            log.warning("Modal not detected via WebDriverWait, checking manually...")
+            time.sleep(2)  # Fallback sleep
+
+        # Check for shadow DOM - this is where LinkedIn renders the modal
+        log.info("Checking for Shadow DOM...")
+        if self.diagnostics.dom_dumps:
+            self.find_all_shadow_hosts()
+
+        # Try common shadow host locations
+        common_shadow_selectors = [
+            "div[id='interop-outlet']",
+            "div[data-testid='interop-outlet']",
+            "#interop-outlet"
+        ]
+
+        modal_in_shadow_dom = False
+        for selector in common_shadow_selectors:
+            try:
+                log.info(f"Checking shadow host: {selector}")
+                dialogs_in_shadow = self.find_in_shadow_dom(selector, "div[role='dialog']")
+                modals_in_shadow = self.find_in_shadow_dom(selector, ".jobs-easy-apply-modal")
+                modal_data_in_shadow = self.find_in_shadow_dom(selector, "div[data-test-modal]")
+
+                if dialogs_in_shadow or modals_in_shadow or modal_data_in_shadow:
+                    log.info(f"*** MODAL FOUND IN SHADOW DOM at {selector}! ***")
+                    modal_in_shadow_dom = True
+                    self.shadow_host_selector = selector  # Store for later use
+                    break
+
+                # Additional check: Look for buttons in shadow DOM
+                buttons_in_shadow = self.find_in_shadow_dom(selector, "button") if self.diagnostics.dom_dumps else []
+                if buttons_in_shadow:
+                    log.info(f"Found {len(buttons_in_shadow)} buttons in shadow DOM at {selector}")
+                    for btn in buttons_in_shadow[:5]:  # Check first 5 buttons
+                        try:
+                            btn_text = self.browser.execute_script('return arguments[0].textContent', btn)
+                            btn_aria = self.browser.execute_script('return arguments[0].getAttribute("aria-label")', btn)
+                            log.info(f"  Shadow button: text='{btn_text.strip()[:50]}', aria-label='{btn_aria}'")
+                        except:
+                            pass
+                    # If we found buttons but not a modal, maybe the modal is inside a nested structure
+                    # Try looking for any div that might be a modal container
+                    all_divs = self.browser.execute_script("""
+                        var shadowHost = arguments[0];
+                        var shadowRoot = shadowHost.shadowRoot;
+                        if (shadowRoot) {
+                            return Array.from(shadowRoot.querySelectorAll('div'));
+                        }
+                        return [];
+                    """, self.browser.find_element(By.CSS_SELECTOR, selector))
+                    log.info(f"Found {len(all_divs)} divs in shadow DOM")
+
+            except Exception as e:
+                log.debug(f"Error checking {selector}: {e}")
+
+        # Check for modal presence with better detection
+        modal_detected = False
+        modal_iframe_index = None  # Index of the iframe that contains the modal, if any
+        dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
+        log.info(f"Found {len(dialogs)} dialog elements")
+
+        # Also check for the specific modal classes
+        try:
+            modal_by_class = self.browser.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-modal")
+            log.info(f"Found {len(modal_by_class)} elements with .jobs-easy-apply-modal class")
+            if modal_by_class:
+                for modal in modal_by_class:
+                    is_displayed = modal.is_displayed()
+                    log.info(f"Modal: displayed={is_displayed}, visible={modal.get_attribute('style')}")
+                    if is_displayed:
+                        modal_detected = True
+        except Exception as e:
+            log.debug(f"Error checking modal by class: {e}")
+
+        # Check for the specific data attribute
+        try:
+            modal_by_data = self.browser.find_elements(By.CSS_SELECTOR, "div[data-test-modal]")
+            log.info(f"Found {len(modal_by_data)} elements with data-test-modal")
+            if modal_by_data:
+                for modal in modal_by_data:
+                    if modal.is_displayed():
+                        modal_detected = True
+        except Exception as e:
+            log.debug(f"Error checking modal by data: {e}")
+
+        if len(dialogs) > 0 or modal_detected:
+            log.info(f"Modal detected! Found {len(dialogs)} dialog(s)")
+            modal_detected = True
+
+        # Additional detailed check for debugging
+        try:
+            dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
+            log.info(f"Immediate check: Found {len(dialogs)} dialog elements")
+            if dialogs and self.diagnostics.dom_dumps:
+                for i, dialog in enumerate(dialogs):
+                    log.info(f"Dialog {i}: displayed={dialog.is_displayed()}, text={dialog.text[:100]}")
+
+            # Check iframes - the modal might be inside one
+            iframes = self.browser.find_elements(By.TAG_NAME, "iframe")
+            log.info(f"Found {len(iframes)} iframes")
+
+            if self.diagnostics.dom_dumps:
+                # Look for the specific interop iframe
+                interop_iframe = None
                 try:
-                    modal_by_data = self.browser.find_elements(By.CSS_SELECTOR, "div[data-test-modal]")
-                    log.info(f"Found {len(modal_by_data)} elements with data-test-modal")
-                    if modal_by_data:
-                        for modal in modal_by_data:
-                            if modal.is_displayed():
-                                modal_detected = True
-                except Exception as e:
-                    log.debug(f"Error checking modal by data: {e}")
-                
-                if len(dialogs) > 0 or modal_detected:
-                    log.info(f"Modal detected! Found {len(dialogs)} dialog(s)")
-                    modal_detected = True
-                
-                # Additional detailed check for debugging
+                    interop_iframe = self.browser.find_element(By.CSS_SELECTOR, "iframe[data-testid='interop-iframe']")
+                    log.info("Found interop-iframe")
+                except:
+                    log.info("No interop-iframe found")
+
+            for i, iframe in enumerate(iframes):
                 try:
-                    dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
-                    log.info(f"Immediate check: Found {len(dialogs)} dialog elements")
-                    if dialogs:
-                        for i, dialog in enumerate(dialogs):
-                            log.info(f"Dialog {i}: displayed={dialog.is_displayed()}, text={dialog.text[:100]}")
-                    
-                    # Check iframes - the modal might be inside one
-                    iframes = self.browser.find_elements(By.TAG_NAME, "iframe")
-                    log.info(f"Found {len(iframes)} iframes")
-                    
-                    # Look for the specific interop iframe
-                    interop_iframe = None
+                    if self.diagnostics.dom_dumps:
+                        # Try to get the iframe src to see what it contains
+                        src = iframe.get_attribute("src")
+                        data_testid = iframe.get_attribute("data-testid")
+                        log.info(f"Iframe {i}: src={src}, data-testid={data_testid}, visible={iframe.is_displayed()}")
+
+                    # Try switching to the iframe
+                    self.browser.switch_to.frame(iframe)
+
+                    # Check for dialog in iframe first (this is the key)
+                    dialogs_in_iframe = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
+                    if dialogs_in_iframe:
+                        log.info(f"  *** Found {len(dialogs_in_iframe)} dialog(s) in iframe {i}! ***")
+                        modal_iframe_index = i
+                        for j, dialog in enumerate(dialogs_in_iframe if self.diagnostics.dom_dumps else []):
+                            log.info(f"    Dialog {j}: text={dialog.text[:100] if dialog.text else 'empty'}")
+
+                    buttons_in_iframe = self.browser.find_elements(By.TAG_NAME, "button") if self.diagnostics.dom_dumps else []
+                    log.debug(f"  Buttons in iframe {i}: {len(buttons_in_iframe)}")
+
+                    # Look specifically for "Next" button
+                    next_found = False
+                    for btn in buttons_in_iframe[:15]:
+                        aria_label = btn.get_attribute("aria-label")
+                        if aria_label and "next" in aria_label.lower():
+                            log.info(f"    *** Found Next button! ***")
+                            log.info(f"    Button: text='{btn.text}', aria-label='{aria_label}'")
+                            next_found = True
+
+                    if not next_found and buttons_in_iframe:
+                        # Log first few buttons anyway
+                        for btn in buttons_in_iframe[:5]:
+                            log.info(f"    Button: text='{btn.text}', aria-label='{btn.get_attribute('aria-label')}'")
+
+                    self.browser.switch_to.default_content()
+                except Exception as iframe_e:
+                    log.info(f"  Could not access iframe {i}: {iframe_e}")
                     try:
-                        interop_iframe = self.browser.find_element(By.CSS_SELECTOR, "iframe[data-testid='interop-iframe']")
-                        log.info("Found interop-iframe")
+                        self.browser.switch_to.default_content()
                     except:
-                        log.info("No interop-iframe found")
-                    
-                    # Store info about which iframe might contain the modal
-                    modal_iframe_index = None
-                    
-                    for i, iframe in enumerate(iframes):
-                        try:
-                            # Try to get the iframe src to see what it contains
-                            src = iframe.get_attribute("src")
-                            data_testid = iframe.get_attribute("data-testid")
-                            log.info(f"Iframe {i}: src={src}, data-testid={data_testid}, visible={iframe.is_displayed()}")
-                            
-                            # Try switching to the iframe
-                            self.browser.switch_to.frame(iframe)
-                            
-                            # Check for dialog in iframe first (this is the key)
-                            dialogs_in_iframe = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
-                            if dialogs_in_iframe:
-                                log.info(f"  *** Found {len(dialogs_in_iframe)} dialog(s) in iframe {i}! ***")
-                                modal_iframe_index = i
-                                for j, dialog in enumerate(dialogs_in_iframe):
-                                    log.info(f"    Dialog {j}: text={dialog.text[:100] if dialog.text else 'empty'}")
-                            
-                            buttons_in_iframe = self.browser.find_elements(By.TAG_NAME, "button")
-                            log.info(f"  Buttons in iframe {i}: {len(buttons_in_iframe)}")
-                            
-                            # Look specifically for "Next" button
-                            next_found = False
-                            for btn in buttons_in_iframe[:15]:
-                                aria_label = btn.get_attribute("aria-label")
-                                if aria_label and "next" in aria_label.lower():
-                                    log.info(f"    *** Found Next button! ***")
-                                    log.info(f"    Button: text='{btn.text}', aria-label='{aria_label}'")
-                                    next_found = True
-                            
-                            if not next_found and buttons_in_iframe:
-                                # Log first few buttons anyway
-                                for btn in buttons_in_iframe[:5]:
-                                    log.info(f"    Button: text='{btn.text}', aria-label='{btn.get_attribute('aria-label')}'")
-                            
-                            self.browser.switch_to.default_content()
-                        except Exception as iframe_e:
-                            log.info(f"  Could not access iframe {i}: {iframe_e}")
-                            try:
-                                self.browser.switch_to.default_content()
-                            except:
-                                pass
-                    
-                    if modal_iframe_index is not None:
-                        log.info(f"Modal is likely in iframe {modal_iframe_index}")
-                except Exception as e:
-                    log.debug(f"Error in immediate check: {e}")
-                
-                # Wait for modal to appear with multiple attempts
-                modal_present = False
-                for attempt in range(3):
+                        pass
+
+            if modal_iframe_index is not None:
+                log.info(f"Modal is likely in iframe {modal_iframe_index}")
+        except Exception as e:
+            log.debug(f"Error in immediate check: {e}")
+
+        # Wait for modal to appear with multiple attempts
+        modal_present = False
+        for attempt in range(3):
+            try:
+                # Try multiple modal selectors
+                modal_selectors = [
+                    "div[data-test-modal]",
+                    ".jobs-easy-apply-modal",
+                    ".artdeco-modal",
+                    "div[role='dialog']",
+                    ".jobs-easy-apply-modal__content"
+                ]
+
+                for selector in modal_selectors:
                     try:
-                        # Try multiple modal selectors
-                        modal_selectors = [
-                            "div[data-test-modal]",
-                            ".jobs-easy-apply-modal",
-                            ".artdeco-modal",
-                            "div[role='dialog']",
-                            ".jobs-easy-apply-modal__content"
-                        ]
-                        
-                        for selector in modal_selectors:
-                            try:
-                                element = self.browser.find_element(By.CSS_SELECTOR, selector)
-                                if element.is_displayed():
-                                    modal_present = True
-                                    log.info(f"Modal detected successfully with selector: {selector}")
-                                    break
-                            except:
-                                pass
-                        
-                        if modal_present:
+                        element = self.browser.find_element(By.CSS_SELECTOR, selector)
+                        if element.is_displayed():
+                            modal_present = True
+                            log.info(f"Modal detected successfully with selector: {selector}")
                             break
-                        
-                        # Debug: Check what's in the page source
-                        if attempt == 0:
-                            log.debug(f"Page title: {self.browser.title}")
-                            log.debug(f"Current URL: {self.browser.current_url}")
-                            # Check for common elements
-                            try:
-                                dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
-                                log.debug(f"Found {len(dialogs)} dialog elements")
-                                buttons = self.browser.find_elements(By.TAG_NAME, "button")
-                                log.debug(f"Total buttons on page: {len(buttons)}")
-                                
-                                # Check if any buttons have "Next" text
-                                for btn in buttons[:10]:  # Check first 10 buttons
-                                    btn_text = btn.text
-                                    aria_label = btn.get_attribute("aria-label")
-                                    if btn_text and "Next" in btn_text:
-                                        log.debug(f"Found button with 'Next' text: '{btn_text}' with aria-label: '{aria_label}'")
-                                    
-                                # Check for iframes
-                                iframes = self.browser.find_elements(By.TAG_NAME, "iframe")
-                                log.debug(f"Found {len(iframes)} iframes on the page")
-                                
-                            except Exception as e:
-                                log.debug(f"Error checking page: {e}")
-                        
-                        time.sleep(2)
-                        log.debug(f"Waiting for modal... attempt {attempt + 1}/5")
-                    except Exception as e:
-                        log.debug(f"Error during modal detection: {e}")
-                        time.sleep(2)
-                
-                if not modal_present:
-                    log.warning("Modal not detected after waiting, proceeding anyway")
-                    log.info("Proceeding to fill out fields...")
-                
-                time.sleep(2)  # Additional wait for form to fully render
-                self.fill_out_fields()
-                result: bool = self.send_resume()
-                if result:
-                    string_easy = "*Applied: Sent Resume"
-                else:
-                    string_easy = "*Did not apply: Failed to send Resume"
-        elif "You applied on" in self.browser.page_source:
-            log.info("You have already applied to this position.")
-            string_easy = "* Already Applied"
-            result = False
-        else:
-            log.info("The Easy apply button does not exist.")
-            string_easy = "* Doesn't have Easy Apply Button"
-            result = False
+                    except:
+                        pass
 
+                if modal_present:
+                    break
+
+                # Debug: Check what's in the page source
+                if attempt == 0 and self.diagnostics.dom_dumps:
+                    log.debug(f"Page title: {self.browser.title}")
+                    log.debug(f"Current URL: {self.browser.current_url}")
+                    # Check for common elements
+                    try:
+                        dialogs = self.browser.find_elements(By.CSS_SELECTOR, "div[role='dialog']")
+                        log.debug(f"Found {len(dialogs)} dialog elements")
+                        buttons = self.browser.find_elements(By.TAG_NAME, "button")
+                        log.debug(f"Total buttons on page: {len(buttons)}")
+
+                        # Check if any buttons have "Next" text
+                        for btn in buttons[:10]:  # Check first 10 buttons
+                            btn_text = btn.text
+                            aria_label = btn.get_attribute("aria-label")
+                            if btn_text and "Next" in btn_text:
+                                log.debug(f"Found button with 'Next' text: '{btn_text}' with aria-label: '{aria_label}'")
 
-        # position_number: str = str(count_job + jobs_per_page)
-        log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
+                        # Check for iframes
+                        iframes = self.browser.find_elements(By.TAG_NAME, "iframe")
+                        log.debug(f"Found {len(iframes)} iframes on the page")
 
-        self.write_to_file(button, jobID, self.browser.title, result)
-        return result
+                    except Exception as e:
+                        log.debug(f"Error checking page: {e}")
+
+                time.sleep(2)
+                log.debug(f"Waiting for modal... attempt {attempt + 1}/5")
+            except Exception as e:
+                log.debug(f"Error during modal detection: {e}")
+                time.sleep(2)
+
+        if modal_in_shadow_dom:
+            return ("shadow", self.shadow_host_selector)
+        if modal_iframe_index is not None:
+            return ("iframe", modal_iframe_index)
+        if modal_present or modal_detected or modal_detected_via_wait:
+            return ("light", None)
+        return None
 
     def write_to_file(self, button, jobID, browserTitle, result) -> None:
         def re_extract(text, pattern):
@@ -757,34 +2451,34 @@ class EasyApplyBot:
 
         timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         attempted: bool = False if button == False else True
-        job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
-        company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+        title_parts: list = browserTitle.split(' | ')
+        job = re_extract(title_parts[0], r"\(?\d?\)?\s?(\w.*)")
+        company = re_extract(title_parts[1], r"(\w.*)") if len(title_parts) > 1 else None
 
-        toWrite: list = [timestamp, jobID, job, company, attempted, result]
-        with open(self.filename, 'a+') as f:
-            writer = csv.writer(f)
-            writer.writerow(toWrite)
+        status: str = "applied" if result else "attempted" if attempted else "skipped"
+        self.ledger.record(jobID, status, job=job, company=company, timestamp=timestamp)
+
+        if self.output is not None:
+            toWrite: list = [timestamp, jobID, job, company, attempted, result]
+            self.output.write(toWrite)
 
     def get_job_page(self, jobID):
 
         job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
+        self.governor.acquire("navigation")
         self.browser.get(job)
-        self.job_page = self.load_page(sleep=0.5)
+        self.job_page = self.load_page(sleep=0.5, locator=(By.TAG_NAME, "h1"))
         return self.job_page
 
     def get_easy_apply_button(self):
         EasyApplyButton = False
         try:
-            buttons = self.get_elements("easy_apply_button")
-            buttons_a = self.get_elements("easy_apply_button_a")
-            all_buttons = buttons + buttons_a
-            for button in all_buttons:
-                if "Easy Apply" in button.text:
-                    EasyApplyButton = button
-                    self.wait.until(EC.element_to_be_clickable(EasyApplyButton))
-                    break
-                else:
-                    log.debug("Easy Apply button not found")
+            # The page is already loaded, so a missing button should not cost a long wait
+            button = self.find("easy_apply_button", clickable=True, text="Easy Apply")
+            if button is not None:
+                EasyApplyButton = button
+            else:
+                log.debug("Easy Apply button not found")
         except Exception as e: 
             print("Exception:",e)
             log.debug("Easy Apply button not found")
@@ -793,10 +2487,7 @@ class EasyApplyBot:
 
     def fill_out_fields(self):
         log.info("Filling out contact info fields")
-        
-        # Wait for the form to be fully loaded
-        time.sleep(1)
-        
+
         # Handle mobile phone number input (email and country code are auto-filled by LinkedIn)
         try:
             inputs = self.browser.find_elements(By.TAG_NAME, "input")
@@ -849,15 +2540,14 @@ class EasyApplyBot:
                 )
                 log.debug(f"Found {len(elements)} elements in shadow DOM with selector '{target_selector}'")
                 
-                # Debug: Log what's actually inside the shadow root
-                if len(elements) == 0 and target_selector == "div[role='dialog']":
-                    all_elements = self.browser.execute_script('return arguments[0].querySelectorAll("*")', shadow_root)
-                    log.debug(f"Shadow DOM contains {len(all_elements)} total elements")
-                    if len(all_elements) > 0:
-                        first_20 = all_elements[:20]
-                        for elem in first_20:
-                            tag = self.browser.execute_script('return arguments[0].tagName', elem)
-                            log.debug(f"  Element in shadow: {tag}")
+                # Debug: Log what's actually inside the shadow root, tag names read in one script call
+                if self.diagnostics.dom_dumps and len(elements) == 0 and target_selector == "div[role='dialog']":
+                    tags = self.browser.execute_script(
+                        'return Array.from(arguments[0].querySelectorAll("*")).map(function (e) { return e.tagName; })',
+                        shadow_root)
+                    log.debug(f"Shadow DOM contains {len(tags)} total elements")
+                    for tag in tags[:20]:
+                        log.debug(f"  Element in shadow: {tag}")
                 
                 return elements
         except Exception as e:
@@ -888,352 +2578,167 @@ class EasyApplyBot:
             log.debug(f"Error finding shadow hosts: {e}")
         return []
 
-    def send_resume(self) -> bool:
-        def is_present(button_locator) -> bool:
-            return len(self.browser.find_elements(button_locator[0],
-                                                  button_locator[1])) > 0
+    def probe_modal_state(self) -> dict:
+        """Snapshot of the Easy Apply modal (buttons, errors, uploads, progress) in one round trip"""
+        ranked: dict = {name: self.selectors.css(name) for name in ("next", "review", "submit")}
+        try:
+            snapshot: dict = self.browser.execute_script(MODAL_STATE_SCRIPT,
+                                                         self.shadow_host_selector or "#interop-outlet", ranked)
+        except Exception as e:
+            log.debug(f"Modal state probe failed: {e}")
+            return {"modal": False, "sent": False, "submit": None, "review": None, "next": None,
+                    "primary": None, "follow": None, "errors": [], "upload_resume": None, "upload_cv": None,
+                    "progress": None, "heading": "", "matched": {}}
+        return snapshot
+
+    def record_step_button(self, snapshot, name) -> None:
+        """Count the selector that found the button clicked on this step, once per step"""
+        selector = snapshot["matched"].get(name)
+        if selector:
+            self.selectors.record_match(name, (By.CSS_SELECTOR, selector))
+
+    def click_element(self, element) -> bool:
+        try:
+            element.click()
+            return True
+        except Exception as click_error:
+            log.debug(f"Native click failed, trying JavaScript click: {click_error}")
+        try:
+            self.browser.execute_script('arguments[0].click()', element)
+            return True
+        except Exception as js_click_error:
+            log.error(f"JavaScript click also failed: {js_click_error}")
+            return False
+
+    def form_state(self, snapshot) -> str:
+        """Which step of the Easy Apply form a modal snapshot shows"""
+        heading: str = snapshot["heading"].lower()
+        if snapshot["sent"]:
+            return FormState.SUBMITTED
+        if not snapshot["modal"]:
+            return FormState.CLOSED
+        if snapshot["submit"] or "review" in heading:
+            return FormState.REVIEW
+        if "contact" in heading:
+            return FormState.CONTACT_INFO
+        if "resume" in heading or snapshot["upload_resume"]:
+            return FormState.RESUME
+        return FormState.QUESTIONS
+
+    @staticmethod
+    def step_signature(snapshot) -> tuple:
+        # Anything that changes when the form moves on, or reacts to a click with new errors
+        return (snapshot["sent"], snapshot["modal"], snapshot["progress"], snapshot["heading"],
+                bool(snapshot["submit"]), bool(snapshot["review"]), tuple(snapshot["errors"]))
+
+    def wait_for_transition(self, signature, timeout=None) -> dict:
+        """Poll the modal until its step signature changes, returns the latest snapshot"""
+        start: float = time.time()
+        deadline: float = start + (timeout if timeout is not None else self.budget.timeout("step_transition"))
+        snapshot: dict = self.probe_modal_state()
+        while self.step_signature(snapshot) == signature and time.time() < deadline:
+            time.sleep(0.25)
+            snapshot = self.probe_modal_state()
+        if self.step_signature(snapshot) != signature:
+            self.budget.observe("step_transition", time.time() - start)
+        return snapshot
 
+    def send_resume(self) -> bool:
+        submitted = False
+        followed = False
+        uploaded: set = set()  # Upload inputs stay on the page, send each file only once
+        stuck = 0
         try:
-            #time.sleep(random.uniform(1.5, 2.5))
-            next_locator = (By.CSS_SELECTOR,
-                            "button[aria-label='Continue to next step']")
-            review_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Review your application']")
-            submit_locator = (By.CSS_SELECTOR,
-                              "button[aria-label='Submit application']")
-            error_locator = (By.CLASS_NAME,"artdeco-inline-feedback__message")
-            upload_resume_locator = (By.XPATH, '//span[text()="Upload resume"]')
-            upload_cv_locator = (By.XPATH, '//span[text()="Upload cover letter"]')
-            # WebElement upload_locator = self.browser.find_element(By.NAME, "file")
-            follow_locator = (By.CSS_SELECTOR, "label[for='follow-company-checkbox']")
-
-            submitted = False
-            loop = 0
-            while loop < 10:
-                log.debug(f"Loop iteration: {loop}")
-                loop += 1
-                time.sleep(1)
-                
-                # Debug: Check what elements are present
-                log.debug(f"Checking elements - upload_resume: {is_present(upload_resume_locator)}, "
-                         f"upload_cv: {is_present(upload_cv_locator)}, "
-                         f"submit: {len(self.get_elements('submit'))}, "
-                         f"error: {len(self.get_elements('error'))}, "
-                         f"next: {len(self.get_elements('next'))}, "
-                         f"review: {len(self.get_elements('review'))}, "
-                         f"follow: {len(self.get_elements('follow'))}")
-                
-                # Debug: Try to find next button with multiple selectors
-                if loop == 1:  # Only log this on first iteration to avoid spam
-                    try:
-                        all_buttons = self.browser.find_elements(By.TAG_NAME, "button")
-                        log.debug(f"Total buttons found on page: {len(all_buttons)}")
-                        for btn in all_buttons:
-                            aria_label = btn.get_attribute("aria-label")
-                            if aria_label:
-                                log.debug(f"Button aria-label: '{aria_label}'")
-                        # Also check for the specific next button
-                        next_btns = self.browser.find_elements(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
-                        log.debug(f"Found {len(next_btns)} buttons with aria-label='Continue to next step'")
-                    except Exception as e:
-                        log.debug(f"Error checking buttons: {e}")
-                
+            snapshot: dict = self.probe_modal_state()
+            if not snapshot["modal"]:
+                # The modal may still be rendering, wait for it before reading the first step
+                snapshot = self.wait_for_transition(self.step_signature(snapshot), timeout=2)
+            for step in range(self.max_form_steps):
+                if self.budget.expired():
+                    log.warning("Application time budget is spent, giving up on this application")
+                    break
+                state: str = self.form_state(snapshot)
+                log.info(f"Easy Apply step {step}: {state}, progress {snapshot['progress']}%, "
+                         f"heading '{snapshot['heading']}'")
+
+                if state == FormState.SUBMITTED:
+                    log.info("Application Submitted")
+                    submitted = True
+                    break
+                if state == FormState.CLOSED:
+                    log.info("Easy Apply modal is closed, skipping application")
+                    break
+
                 # Upload resume
-                if is_present(upload_resume_locator):
-                    #upload_locator = self.browser.find_element(By.NAME, "file")
+                if snapshot["upload_resume"] and "Resume" in self.uploads and "Resume" not in uploaded:
                     try:
-                        resume_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-resume')]")
-                        resume = self.uploads["Resume"]
-                        resume_locator.send_keys(resume)
+                        snapshot["upload_resume"].send_keys(self.uploads["Resume"])
+                        uploaded.add("Resume")
                     except Exception as e:
                         log.error(e)
                         log.error("Resume upload failed")
-                        log.debug("Resume: " + resume)
-                        log.debug("Resume Locator: " + str(resume_locator))
+                        log.debug("Resume: " + self.uploads["Resume"])
                 # Upload cover letter if possible
-                if is_present(upload_cv_locator):
-                    cv = self.uploads["Cover Letter"]
-                    cv_locator = self.browser.find_element(By.XPATH, "//*[contains(@id, 'jobs-document-upload-file-input-upload-cover-letter')]")
-                    cv_locator.send_keys(cv)
-
-                    #time.sleep(random.uniform(4.5, 6.5))
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                if len(self.get_elements("submit")) > 0:
-                    elements = self.get_elements("submit")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-                        log.info("Application Submitted")
-                        submitted = True
-                        break
-
-                elif len(self.get_elements("error")) > 0:
-                    elements = self.get_elements("error")
-                    if "application was sent" in self.browser.page_source:
+                if snapshot["upload_cv"] and "Cover Letter" in self.uploads and "Cover Letter" not in uploaded:
+                    try:
+                        snapshot["upload_cv"].send_keys(self.uploads["Cover Letter"])
+                        uploaded.add("Cover Letter")
+                    except Exception as e:
+                        log.error(e)
+                        log.error("Cover letter upload failed")
+                elif snapshot["follow"] and not followed:
+                    followed = self.click_element(snapshot["follow"])
+
+                if snapshot["errors"]:
+                    log.info(f"Answering questions on this step: {snapshot['errors']}")
+                    self.process_questions()
+
+                if state == FormState.REVIEW:
+                    # When no submit selector matches, the last primary button is the Submit button,
+                    # so any click on the review step is paced as a submission
+                    button = snapshot["submit"] or snapshot["primary"]
+                    if button is not None:
+                        self.governor.acquire("submission")
+                    if snapshot["submit"] and self.click_element(button):
+                        self.record_step_button(snapshot, "submit")
                         log.info("Application Submitted")
                         submitted = True
                         break
-                    elif len(elements) > 0:
-                        while len(elements) > 0:
-                            log.info("Please answer the questions, waiting 5 seconds...")
-                            time.sleep(5)
-                            elements = self.get_elements("error")
-
-                            for element in elements:
-                                self.process_questions()
-
-                            if "application was sent" in self.browser.page_source:
-                                log.info("Application Submitted")
-                                submitted = True
-                                break
-                            elif is_present(self.locator["easy_apply_button"]):
-                                log.info("Skipping application")
-                                submitted = False
-                                break
-                        continue
-                        #add explicit wait
-                    
-                    else:
-                        log.info("Application not submitted")
-                        time.sleep(2)
-                        break
-                    # self.process_questions()
-
-                elif len(self.get_elements("next")) > 0:
-                    log.info("Found 'Continue to next step' button - clicking it")
-                    elements = self.get_elements("next")
-                    log.debug(f"Found {len(elements)} 'next' button(s)")
-                    clicked = False
-                    for element in elements:
-                        try:
-                            button = self.wait.until(EC.element_to_be_clickable(element))
-                            log.debug(f"Next button is clickable, attempting click")
-                            button.click()
-                            log.info("Clicked 'Next' button successfully")
-                            clicked = True
+                else:
+                    button = snapshot["next"] or snapshot["review"] or snapshot["primary"]
+                signature: tuple = self.step_signature(snapshot)
+                if button is None or not self.click_element(button):
+                    log.debug("No usable button on this step")
+                    new_snapshot: dict = self.wait_for_transition(signature, timeout=2)
+                else:
+                    for name in ("submit", "next", "review"):
+                        if button is snapshot[name]:
+                            self.record_step_button(snapshot, name)
                             break
-                        except Exception as click_error:
-                            log.error(f"Failed to click Next button with native click: {click_error}")
-                            # Try JavaScript click - required for elements in shadow DOM
-                            try:
-                                log.info("Trying JavaScript click for Next button")
-                                self.browser.execute_script('arguments[0].click()', button)
-                                log.info("Clicked Next button using JavaScript")
-                                clicked = True
-                                break
-                            except Exception as js_click_error:
-                                log.error(f"JavaScript click also failed: {js_click_error}")
-                    
-                    if not clicked:
-                        # Try alternative selectors if main selector failed
-                        try:
-                            log.info("Trying alternative selector: button[data-easy-apply-next-button]")
-                            alternative_button = self.browser.find_element(By.CSS_SELECTOR, "button[data-easy-apply-next-button]")
-                            alternative_button.click()
-                            log.info("Clicked Next button using alternative selector")
-                            clicked = True
-                        except Exception as alt_error:
-                            log.error(f"Alternative selector also failed: {alt_error}")
-                            try:
-                                log.info("Trying alternative selector: button.artdeco-button--primary")
-                                primary_buttons = self.browser.find_elements(By.CSS_SELECTOR, "button.artdeco-button--primary")
-                                if primary_buttons:
-                                    primary_buttons[-1].click()  # Click the last primary button
-                                    log.info("Clicked Next button using primary class")
-                                    clicked = True
-                            except Exception as alt2_error:
-                                log.error(f"Third attempt failed: {alt2_error}")
-                    
-                    if clicked:
-                        time.sleep(2)  # Wait for next page to load
-                
-                elif len(self.get_elements("next_generic")) > 0:
-                    log.info("Found 'Next' button by text - clicking it")
-                    elements = self.get_elements("next_generic")
-                    log.debug(f"Found {len(elements)} generic 'Next' button(s)")
-                    clicked = False
-                    for element in elements:
-                        try:
-                            # Only click if it's displayed
-                            if element.is_displayed():
-                                button = self.wait.until(EC.element_to_be_clickable(element))
-                                log.debug(f"Next button is clickable, attempting click")
-                                button.click()
-                                log.info("Clicked generic 'Next' button successfully")
-                                clicked = True
-                                break
-                        except Exception as click_error:
-                            log.debug(f"Failed to click generic Next button: {click_error}")
-                            try:
-                                self.browser.execute_script('arguments[0].click()', element)
-                                log.info("Clicked generic Next button using JavaScript")
-                                clicked = True
-                                break
-                            except:
-                                pass
-                    
-                    if clicked:
-                        time.sleep(2)
-                
-                # Try to click button inside shadow DOM using JavaScript
-                if self.shadow_host_selector:
-                    try:
-                        log.info(f"Attempting to click Next button inside shadow DOM at {self.shadow_host_selector}")
-                        # Use JavaScript to find and click the button inside the shadow DOM
-                        button_clicked = self.browser.execute_script("""
-                            // Find the shadow host
-                            var shadowHost = arguments[0];
-                            var shadowRoot = shadowHost.shadowRoot;
-                            if (shadowRoot) {
-                                // Try multiple selectors to find the Next button
-                                var button = shadowRoot.querySelector('button[aria-label="Continue to next step"]') ||
-                                            shadowRoot.querySelector('button[data-easy-apply-next-button]') ||
-                                            shadowRoot.querySelector('button.artdeco-button--primary');
-                                if (button) {
-                                    // Scroll into view first
-                                    button.scrollIntoView({behavior: 'smooth', block: 'center'});
-                                    // Dispatch a proper click event
-                                    button.click();
-                                    return true;
-                                }
-                            }
-                            return false;
-                        """, self.browser.find_element(By.CSS_SELECTOR, self.shadow_host_selector))
-                        
-                        if button_clicked:
-                            log.info("Successfully clicked Next button inside shadow DOM via JavaScript")
-                            time.sleep(2)
-                            continue  # Skip to next loop iteration
-                    except Exception as shadow_error:
-                        log.debug(f"Failed to click button in shadow DOM: {shadow_error}")
-                
-                # Try data attribute selector
-                try:
-                    alt_button = self.browser.find_element(By.CSS_SELECTOR, "button[data-easy-apply-next-button]")
-                    if alt_button.is_displayed():
-                        log.info("Found Next button using data-easy-apply-next-button attribute")
-                        alt_button.click()
-                        log.info("Clicked Next button successfully")
-                        time.sleep(2)
-                        continue  # Skip to next loop iteration
-                except Exception as e:
-                    log.debug(f"No button with data-easy-apply-next-button: {e}")
-                
-                # Try artdeco-button--primary class
-                try:
-                    primary_buttons = self.browser.find_elements(By.CSS_SELECTOR, "button.artdeco-button--primary")
-                    displayed_primary = [btn for btn in primary_buttons if btn.is_displayed()]
-                    if displayed_primary:
-                        log.info(f"Found {len(displayed_primary)} primary buttons, clicking the last one")
-                        displayed_primary[-1].click()  # Click the last primary button (usually the Next button)
-                        log.info("Clicked Next button using primary class")
-                        time.sleep(2)
-                        continue  # Skip to next loop iteration
-                except Exception as e:
-                    log.debug(f"Error with primary buttons: {e}")
-                
-                # Additional check for any button with aria-label containing "next" or "Continue"
-                found_button = False
-                try:
-                    all_buttons = self.browser.find_elements(By.TAG_NAME, "button")
-                    for btn in all_buttons:
-                        if not btn.is_displayed():
-                            continue
-                        aria_label = btn.get_attribute("aria-label")
-                        if aria_label and ("next" in aria_label.lower() or "continue" in aria_label.lower()):
-                            log.info(f"Found button with aria-label: '{aria_label}'")
-                            try:
-                                btn.click()
-                                log.info("Clicked button successfully")
-                                time.sleep(2)
-                                found_button = True
-                                break  # Exit the for loop
-                            except:
-                                try:
-                                    self.browser.execute_script('arguments[0].click()', btn)
-                                    log.info("Clicked button using JavaScript")
-                                    time.sleep(2)
-                                    found_button = True
-                                    break
-                                except:
-                                    pass
-                    # if we found and clicked a button, skip to next iteration
-                    if found_button:
-                        continue
-                except Exception as e:
-                    log.debug(f"Error in fallback button search: {e}")
+                    new_snapshot = self.wait_for_transition(signature)
 
-                # Check for review button
-                if len(self.get_elements("review")) > 0:
-                    elements = self.get_elements("review")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
-
-                # Check for follow button
-                elif len(self.get_elements("follow")) > 0:
-                    elements = self.get_elements("follow")
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.click()
+                if self.step_signature(new_snapshot) == signature:
+                    stuck += 1
                 else:
-                    log.debug("No buttons found on this step. Waiting...")
-                    # Last resort: search for ANY button with "Next" aria-label
-                    try:
-                        all_buttons = self.browser.find_elements(By.TAG_NAME, "button")
-                        for btn in all_buttons:
-                            aria_label = btn.get_attribute("aria-label")
-                            btn_text = btn.text.strip()
-                            # Look for "Next" button
-                            if aria_label and ("next" in aria_label.lower() or "Next" in aria_label):
-                                log.info(f"Found Next button with aria-label: '{aria_label}'")
-                                try:
-                                    btn.click()
-                                    log.info("Successfully clicked Next button")
-                                    time.sleep(2)
-                                    break
-                                except:
-                                    try:
-                                        self.browser.execute_script('arguments[0].click()', btn)
-                                        log.info("Clicked Next button with JavaScript")
-                                        time.sleep(2)
-                                        break
-                                    except:
-                                        pass
-                            elif btn_text and "Next" in btn_text and btn.is_displayed():
-                                log.info(f"Found Next button with text: '{btn_text}'")
-                                try:
-                                    btn.click()
-                                    log.info("Successfully clicked Next button")
-                                    time.sleep(2)
-                                    break
-                                except:
-                                    try:
-                                        self.browser.execute_script('arguments[0].click()', btn)
-                                        log.info("Clicked Next button with JavaScript")
-                                        time.sleep(2)
-                                        break
-                                    except:
-                                        pass
-                    except Exception as e:
-                        log.debug(f"Error in fallback Next button search: {e}")
-                    
-                    time.sleep(2)
+                    stuck = 0
+                if stuck >= 2:
+                    log.warning(f"Easy Apply form is {FormState.STUCK} on {state}, giving up on this application")
+                    break
+                snapshot = new_snapshot
+            else:
+                log.warning(f"Easy Apply form did not finish in {self.max_form_steps} steps")
 
+        except (QuestionDeferred, DailyQuotaReached):
+            raise
         except Exception as e:
             log.error(e)
             log.error("cannot apply to this job")
+            self.diagnostics.capture(self.browser, "send_resume_error")
             pass
             #raise (e)
 
         return submitted
     def process_questions(self):
-        time.sleep(1)
         form = self.get_elements("fields") #self.browser.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-section__grouping")
         for field in form:
             question = field.text
@@ -1278,61 +2783,58 @@ class EasyApplyBot:
                 input = form.find_element(By.CLASS_NAME, "artdeco-text-input--input")
                 input.send_keys(answer)
 
-    def ans_question(self, question): #refactor this to an ans.yaml file
-        answer = None
-        if "how many" in question:
-            answer = "1"
-        elif "experience" in question:
-            answer = "1"
-        elif "sponsor" in question:
-            answer = "No"
-        elif 'do you ' in question:
-            answer = "Yes"
-        elif "have you " in question:
-            answer = "Yes"
-        elif "US citizen" in question:
-            answer = "Yes"
-        elif "are you " in question:
-            answer = "Yes"
-        elif "salary" in question:
-            answer = self.salary
-        elif "can you" in question:
-            answer = "Yes"
-        elif "gender" in question:
-            answer = "Male"
-        elif "race" in question:
-            answer = "Wish not to answer"
-        elif "lgbtq" in question:
-            answer = "Wish not to answer"
-        elif "ethnicity" in question:
-            answer = "Wish not to answer"
-        elif "nationality" in question:
-            answer = "Wish not to answer"
-        elif "government" in question:
-            answer = "I do not wish to self-identify"
-        elif "are you legally" in question:
-            answer = "Yes"
-        else:
+    def ans_question(self, question):
+        answer = self.rules.match(question)
+        if answer is None and self.answers.get(question, "user provided") != "user provided":
+            answer = self.answers[question]
+        if answer is None:
+            if self.unanswered_questions == "defer":
+                log.info("Not able to answer question automatically, parking this application")
+                raise QuestionDeferred(question)
             log.info("Not able to answer question automatically. Please provide answer")
-            #open file and document unanswerable questions, appending to it
             answer = "user provided"
             time.sleep(15)
-
-            # df = pd.DataFrame(self.answers, index=[0])
-            # df.to_csv(self.qa_file, encoding="utf-8")
         log.info("Answering question: " + question + " with answer: " + answer)
+        self.form_answers[question] = answer
+        self.save_answer(question, answer)
+        return answer
 
-        # Append question and answer to the CSV
-        if question not in self.answers:
-            self.answers[question] = answer
-            # Append a new question-answer pair to the CSV file
-            new_data = pd.DataFrame({"Question": [question], "Answer": [answer]})
-            new_data.to_csv(self.qa_file, mode='a', header=False, index=False, encoding='utf-8')
-            log.info(f"Appended to QA file: '{question}' with answer: '{answer}'.")
+    def save_answer(self, question, answer) -> None:
+        # Buffer new question and answer pairs, the QA store writes them out in batches
+        if self.answers.get(question, "user provided") == "user provided":
+            self.answers.add(question, answer)
+            log.info(f"Added to QA file: '{question}' with answer: '{answer}'.")
 
-        return answer
+    def load_page(self, sleep=1, locator=None):
+        if self.page_load_mode == "sleep":
+            return self.load_page_fixed(sleep)
+
+        ready: bool = self.wait_for_page_ready(locator)
+        if self.network_filter is not None:
+            self.network_filter.record_page(self.browser)
+        return PageSnapshot(self.browser, ready)
+
+    def wait_for_page_ready(self, locator=None, quiet_ms=500, timeout=10) -> bool:
+        """Wait until the locator is present and the DOM has stopped mutating"""
+        start: float = time.time()
+        if locator is not None:
+            try:
+                self.wait_until("page_ready", EC.presence_of_element_located(locator))
+            except TimeoutException:
+                log.debug(f"Timeout waiting for {locator[1]}, page may be empty")
+                return False
 
-    def load_page(self, sleep=1):
+        remaining_ms = max(int((timeout - (time.time() - start)) * 1000), quiet_ms)
+        try:
+            self.browser.set_script_timeout(remaining_ms / 1000 + 5)
+            quiet: bool = self.browser.execute_async_script(PAGE_QUIESCENCE_SCRIPT, quiet_ms, remaining_ms)
+        except Exception as e:
+            log.debug(f"Page quiescence check failed: {e}")
+            return False
+        log.debug(f"Page ready in {round(time.time() - start, 2)}s (quiet={quiet})")
+        return quiet
+
+    def load_page_fixed(self, sleep=1):
         scroll_page = 0
         while scroll_page < 4000:
             self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
@@ -1343,37 +2845,27 @@ class EasyApplyBot:
             self.browser.execute_script("window.scrollTo(0,0);")
             time.sleep(sleep)
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+        return PageSnapshot(self.browser)
 
-    def avoid_lock(self) -> None:
-        x, _ = pyautogui.position()
-        pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
-        pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
-        pyautogui.keyDown('ctrl')
-        pyautogui.press('esc')
-        pyautogui.keyUp('ctrl')
-        time.sleep(0.5)
-        pyautogui.press('esc')
-
-    def next_jobs_page(self, position, location, jobs_per_page, experience_level=[]):
+    def next_jobs_page(self, position, location, start, experience_level=[]):
         # Construct the experience level part of the URL
         experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
         experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
+        self.governor.acquire("navigation")
         self.browser.get(
             # URL for jobs page
             "https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
-            position + location + "&start=" + str(jobs_per_page) + experience_level_param)
-        #self.avoid_lock()
-        log.info("Loading next job page?")
-        self.load_page()
-        return (self.browser, jobs_per_page)
+            position + location + "&start=" + str(start) + experience_level_param)
+        log.info(f"Loading results page starting at {start}")
+        page: PageSnapshot = self.load_page(locator=self.locator["links"])
+        return (self.browser, page.ready)
 
     # def finish_apply(self) -> None:
     #     self.browser.close()
 
 
 if __name__ == '__main__':
+    setupLogger()
 
     with open("config.yaml", 'r') as stream:
         try:
@@ -1416,7 +2908,44 @@ if __name__ == '__main__':
                        filename=output_filename,
                        blacklist=blacklist,
                        blackListTitles=blackListTitles,
-                       experience_level=parameters.get('experience_level', [])
+                       include_titles=parameters.get('include_titles') or [],
+                       include_locations=parameters.get('include_locations') or [],
+                       experience_level=parameters.get('experience_level', []),
+                       ledger_file=parameters.get('ledger_file'),
+                       retention_days=parameters.get('retention_days', 2),
+                       page_load_mode=parameters.get('page_load_mode', 'event'),
+                       workers=parameters.get('workers', 1),
+                       rate_limits=parameters.get('rate_limits') or {},
+                       daily_quota=parameters.get('daily_quota') or {},
+                       jitter=parameters.get('jitter') or {},
+                       governor_state_file=parameters.get('governor_state_file', 'rate_governor.json'),
+                       cursor_file=parameters.get('cursor_file', 'search_cursors.json'),
+                       max_stale_pages=parameters.get('max_stale_pages', 2),
+                       max_run_minutes=parameters.get('max_run_minutes'),
+                       pipeline=parameters.get('pipeline', False),
+                       queue_size=parameters.get('queue_size', 100),
+                       queue_file=parameters.get('queue_file'),
+                       rules_file=parameters.get('rules_file', 'qa_rules.yaml'),
+                       unanswered_questions=parameters.get('unanswered_questions', 'defer'),
+                       parked_file=parameters.get('parked_file', 'parked_applications.json'),
+                       pending_questions_file=parameters.get('pending_questions_file', 'pending_questions.csv'),
+                       qa_file=parameters.get('qa_file', 'qa.csv'),
+                       qa_flush_every=parameters.get('qa_flush_every', 20),
+                       output_format=parameters.get('output_format', 'csv'),
+                       chromedriver_path=parameters.get('chromedriver_path'),
+                       profile_path=parameters.get('profile_path'),
+                       session_file=parameters.get('session_file', 'linkedin_session.json'),
+                       browser_mode=parameters.get('browser_mode', 'normal'),
+                       network_filter=parameters.get('network_filter', False),
+                       block_url_patterns=parameters.get('block_url_patterns'),
+                       block_resource_types=parameters.get('block_resource_types', []),
+                       cache_dir=parameters.get('cache_dir'),
+                       diagnostics=parameters.get('diagnostics', 'on-failure'),
+                       diagnostics_max_files=parameters.get('diagnostics_max_files', 200),
+                       max_form_steps=parameters.get('max_form_steps', 15),
+                       selectors_file=parameters.get('selectors_file', 'selector_stats.json'),
+                       wait_factor=parameters.get('wait_factor', 2.0),
+                       application_budget=parameters.get('application_budget', 180)
                        )
     bot.start_apply(positions, locations)
 